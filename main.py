@@ -1,16 +1,17 @@
 # scrape_delaware_daily.py
 import asyncio
-import json
 import os
+import random
 import traceback
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
+import re
 import time
 from collections import defaultdict
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote_plus
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import orjson
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
 
@@ -20,9 +21,159 @@ from google.oauth2 import service_account
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 SPREADSHEET_ID = os.environ.get("SPREADSHEET_ID")
 
+# Requests the scraper never needs. Stylesheets stay: EasyUI panels and tabs rely on
+# CSS for visibility, and the locators wait for state="visible".
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "websocket"}
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+# onclick="loadRecord('<caseFileId>','<caseFileNum>',...)" on each result row
+LOAD_RECORD_RE = re.compile(r"loadRecord\('([^']*)'\s*,\s*'([^']*)'")
+# caseFileId/caseFileNum query parameters of the DocumentInfoView.jsp frame URL
+CASE_META_RE = re.compile(r"[?&](caseFileId|caseFileNum)=([^&#]+)")
+MDY_DATE_RE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})\s*$")
+# A representative row is an address if it has a digit or a street word
+ADDRESS_HINT_RE = re.compile(
+    r"\d|\b(?:AVE|ST|STREET|AVENUE|ROAD|RD|LANE|LN|DR|DRIVE|APT|SUITE|PO BOX|BLVD|COURT|CT)\b",
+    re.IGNORECASE,
+)
+ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+
+# Record links in resultListFrame, one per result row
+ROW_LINKS_SEL = "a.link[id^='inst'], a.link[onclick*='loadRecord']"
+# Striped data rows of the Representatives panel in docInfoFrame
+REP_ROWS_SEL = "tr.evenrow, tr.oddrow"
+# Every known form of the 'Back to Results' control in resnavframe
+BACK_BUTTON_SEL = (
+    ":text-is('Back to Results'), "
+    "a[onclick*='executeSearchNav'][onclick*='results'], "
+    "img[alt='Back to Results']"
+)
+
+# Clicks a collected result row inside resultListFrame: by id, else by position in the list
+CLICK_RESULT_ROW_JS = """
+(body, [meta, rowLinksSel]) => {
+    const a = (meta.id && document.getElementById(meta.id))
+        || document.querySelectorAll(rowLinksSel)[meta.index];
+    if (!a) return false;
+    a.click();
+    return true;
+}
+"""
+
+# Waits inside docInfoFrame for the Representatives panel and returns its row texts: as soon
+# as the header text shows, or once rows have been present past the header grace period
+REP_ROWS_JS = """
+async (body, [rowsSel, headerMs, timeoutMs]) => {
+    const start = Date.now();
+    const readRows = () => Array.from(document.querySelectorAll(rowsSel), r => r.textContent);
+    while (true) {
+        const elapsed = Date.now() - start;
+        const hasRows = document.querySelector(rowsSel) !== null;
+        if (document.body.innerText.includes("Personal Representative")
+                || (hasRows && elapsed > headerMs) || elapsed > timeoutMs) {
+            return readRows();
+        }
+        await new Promise(r => setTimeout(r, 100));
+    }
+}
+"""
+
+# Triggers the results pager inside the frame holding the pageNumber input: the page's own
+# goToResultPage(), else a Go control that calls it. Raw string for the \s in the regex.
+GO_TO_RESULT_PAGE_JS = r"""
+() => {
+    try {
+        if (typeof goToResultPage === 'function') { goToResultPage(); return true; }
+        const goBtn = Array.from(document.querySelectorAll('a, input, button')).find(el =>
+            (el.getAttribute && (el.getAttribute('onclick') || '').includes('goToResultPage')) ||
+            (el.textContent && /go\s*to\s*result/i.test(el.textContent))
+        );
+        if (goBtn) { goBtn.click(); return true; }
+        return false;
+    } catch (e) {
+        return false;
+    }
+}
+"""
+
+# Clicks the EasyUI tab whose title contains the given text, inside the tabs frame
+CLICK_TAB_JS = """
+(body, text) => {
+    const span = Array.from(document.querySelectorAll("span.tabs-title"))
+        .find(x => x.textContent.trim().includes(text));
+    if (span) { span.click(); return true; }
+    const li = Array.from(document.querySelectorAll("li")).find(x => x.textContent.includes(text));
+    if (li) { li.click(); return true; }
+    return false;
+}
+"""
+
+# Reads the decedent fields inside docInfoFrame in one round trip, waiting in the frame for
+# the filing date to render. Each value is the third cell of the row holding the field's
+# label span (same XPath the locators used).
+DECEDENT_FIELDS_JS = """
+async (body, timeoutMs) => {
+    const first = (xpath, ctx) => document.evaluate(
+        xpath, ctx || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const text = (el) => ((el && el.textContent) || "").trim();
+    const field = (id) => {
+        const span = document.getElementById(id);
+        return span ? text(first("ancestor::tr/td[3]", span)) : "";
+    };
+    const read = () => {
+        const stSpan = document.getElementById("fcstateCORESPONDENT_ADDRESSspan");
+        const stCell = stSpan && first("ancestor::tr/td[3]", stSpan);
+        const nested = stCell ? stCell.querySelectorAll("table tr td") : [];
+        let zip = text(nested[2]);
+        if (!zip) {
+            zip = text(first("//span[@id='fczipCORESPONDENT_ADDRESSspan']/ancestor::td[1]/following-sibling::td[1]"));
+        }
+        return {
+            filing_date: field("fieldFILING_DATEspan"),
+            case_file_no: field("fieldCASENUMBERspan"),
+            addr: field("fcaddrCORESPONDENT_ADDRESSspan"),
+            city: field("fccityCORESPONDENT_ADDRESSspan"),
+            state: text(nested[0]),
+            zip: zip,
+        };
+    };
+    // Poll in the frame until the filing date renders, instead of one round trip per try
+    const start = Date.now();
+    let fields = read();
+    while (!fields.filing_date && Date.now() - start < timeoutMs) {
+        await new Promise(r => setTimeout(r, 100));
+        fields = read();
+    }
+    return fields;
+}
+"""
+
 # -----------------------------
 # Google Sheets Helpers
 # -----------------------------
+def backoff_delay(attempt: int, base: float) -> float:
+    """Seconds to wait before retry number attempt (0-based): doubling from base, plus jitter."""
+    return base * 2 ** attempt + random.random() * 0.1
+
+
+def parse_filing_date(filing_date):
+    """Return (year, month, day) for a valid M/D/YYYY, M/D/YY or YYYY-MM-DD date, else None."""
+    m = MDY_DATE_RE.match(filing_date or "")
+    if m:
+        month, day, year = map(int, m.groups())
+        if len(m.group(3)) == 2:
+            year += 2000 if year < 69 else 1900  # same pivot as strptime's %y
+    else:
+        m = ISO_DATE_RE.match(filing_date or "")
+        if not m:
+            return None
+        year, month, day = map(int, m.groups())
+    try:
+        date(year, month, day)
+    except ValueError:  # e.g. 13/01/2025 or 02/30/2025
+        return None
+    return year, month, day
+
 def load_service_account_info():
     """Load Google service account credentials with detailed logging."""
     print("🔑 Loading Google service account credentials...")
@@ -30,8 +181,7 @@ def load_service_account_info():
     if file_env:
         if os.path.exists(file_env):
             print(f"📁 Using credentials file: {file_env}")
-            with open(file_env, "r", encoding="utf-8") as fh:
-                return json.load(fh)
+            return orjson.loads(Path(file_env).read_bytes())
         raise ValueError(f"GOOGLE_CREDENTIALS_FILE set but not found: {file_env}")
 
     creds_raw = os.environ.get("GOOGLE_CREDENTIALS")
@@ -42,12 +192,11 @@ def load_service_account_info():
     txt = creds_raw.strip()
     if txt.startswith("{"):
         print("✅ Credentials are valid JSON")
-        return json.loads(txt)
+        return orjson.loads(txt)
 
     if os.path.exists(creds_raw):
         print(f"📁 Credentials point to existing file: {creds_raw}")
-        with open(creds_raw, "r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return orjson.loads(Path(creds_raw).read_bytes())
 
     raise ValueError("GOOGLE_CREDENTIALS is neither valid JSON nor an existing file path.")
 
@@ -91,15 +240,14 @@ def get_last_scraped_date(svc, spreadsheet_id):
                 print(f"    📋 Found {len(vals)} dates in sheet {sheet_name}")
                 
                 for date_str in vals:
-                    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
-                        try:
-                            date_obj = datetime.strptime(date_str, fmt).date()
-                            if max_date is None or date_obj > max_date:
-                                max_date = date_obj
-                                print(f"    🆕 New latest date: {max_date}")
-                            break
-                        except ValueError:
-                            continue
+                    # parse_filing_date returns None for impossible dates; only a new maximum becomes a date object
+                    parsed = parse_filing_date(date_str)
+                    if parsed is None:
+                        continue
+                    if max_date is not None and parsed <= (max_date.year, max_date.month, max_date.day):
+                        continue
+                    max_date = date(*parsed)
+                    print(f"    🆕 New latest date: {max_date}")
                             
             except Exception as e:
                 print(f"    ⚠️ Could not read dates from sheet {sheet_name}: {e}")
@@ -128,18 +276,9 @@ def append_to_google_sheets(svc, spreadsheet_id, records):
     # Group records by month
     by_month = defaultdict(list)
     for record in records:
-        filing_date = record.get("filing_date", "")
-        month_key = "Unknown"
-        
         # Parse date to determine sheet name
-        for fmt in ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d"):
-            try:
-                dt_obj = datetime.strptime(filing_date, fmt)
-                month_key = dt_obj.strftime("%Y-%m")
-                break
-            except ValueError:
-                continue
-        
+        parsed = parse_filing_date(record.get("filing_date", ""))
+        month_key = f"{parsed[0]:04d}-{parsed[1]:02d}" if parsed else "Unknown"
         by_month[month_key].append(record)
 
     total_appended = 0
@@ -161,14 +300,11 @@ def append_to_google_sheets(svc, spreadsheet_id, records):
             formatted_date = filing_date
             
             # Try to parse and reformat the date
-            for fmt in ("%m/%d/%Y", "%m/%d/%y"):
-                try:
-                    dt_obj = datetime.strptime(filing_date, fmt)
-                    formatted_date = dt_obj.strftime("%Y-%m-%d")
-                    print(f"  🔄 Converted date: {filing_date} -> {formatted_date}")
-                    break
-                except ValueError:
-                    continue
+            parsed = parse_filing_date(filing_date)
+            if parsed and MDY_DATE_RE.match(filing_date):
+                y, m, d = parsed
+                formatted_date = f"{y:04d}-{m:02d}-{d:02d}"
+                print(f"  🔄 Converted date: {filing_date} -> {formatted_date}")
             
             values.append([
                 record.get("case_file_no", ""),
@@ -247,88 +383,142 @@ class DelawareScraper:
         self.browser = browser
         self.context = context
         self.base_url = base_url
+        self._prev_page_ids = set()
+        self._frame_waiters = []
+        self._frame_cache = {}  # (parent_frame, name) -> Frame, dropped on framedetached
+        self._init_locators()
+        self.page.on("frameattached", self._on_frame)
+        self.page.on("framenavigated", self._on_frame)
+        self.page.on("framedetached", self._on_frame_detached)
         print(f"🌐 Scraper initialized with URL: {base_url}")
 
     # === FRAME LOCATOR METHODS ===
+    def _init_locators(self):
+        """Build the frame locator chains once; they re-resolve lazily on every use."""
+        body = self.page.frame_locator("iframe[name='bodyframe']")
+        result = body.frame_locator("iframe[name='resultFrame']")
+        self._res_list = result.frame_locator("iframe[name='resultListFrame']")
+        self._res_subnav_middle = result.frame_locator("iframe[src*='navbar.do?page=search.resultNav.middle']")
+        self._doc = body.frame_locator("iframe[name='documentFrame']").frame_locator("iframe[name='docInfoFrame']")
+        self._tabs = self._doc.frame_locator("iframe[name='tabs']")
+        self._row_links = self._res_list.locator(ROW_LINKS_SEL)
+
     def _res_list_loc(self):
-        return (
-            self.page
-            .frame_locator("iframe[name='bodyframe']")
-            .frame_locator("iframe[name='resultFrame']")
-            .frame_locator("iframe[name='resultListFrame']")
-        )
+        return self._res_list
+
+    def _row_links_loc(self):
+        return self._row_links
 
     def _res_subnav_middle_loc(self):
-        return (
-            self.page
-            .frame_locator("iframe[name='bodyframe']")
-            .frame_locator("iframe[name='resultFrame']")
-            .frame_locator("iframe[src*='navbar.do?page=search.resultNav.middle']")
-        )
+        return self._res_subnav_middle
 
     def _doc_loc(self):
-        return (
-            self.page
-            .frame_locator("iframe[name='bodyframe']")
-            .frame_locator("iframe[name='documentFrame']")
-            .frame_locator("iframe[name='docInfoFrame']")
-        )
+        return self._doc
 
     def _tabs_loc(self):
-        return self._doc_loc().frame_locator("iframe[name='tabs']")
+        return self._tabs
 
     async def ensure_decedent_tab(self):
         """Ensure the decedent panel is visible."""
         print("  🔄 Ensuring decedent tab is active...")
+        # The filing date field only shows while the decedent panel is the active tab
         try:
-            if await self._doc_loc().locator("text=Estate Info").first.is_visible():
+            if await self._doc_loc().locator("#fieldFILING_DATEspan").first.is_visible():
                 print("  ✅ Decedent tab already active")
                 return
-        except:
+        except Exception:
             pass
-        
+
+        # One in-frame call per label; "Decedent" also matches "Decedent & Estate Info"
         tabs = self._tabs_loc()
+        for label in ["Decedent", "Estate Info"]:
+            try:
+                if await tabs.locator("body").evaluate(CLICK_TAB_JS, label, timeout=2000):
+                    print("  ✅ Tab clicked successfully")
+                    return
+            except PlaywrightError:
+                break  # no tabs frame to click in, or it navigated/detached mid-call
+
         for label in ["Decedent & Estate Info", "Decedent", "Estate Info"]:
             try:
                 print(f"  🔄 Clicking tab: {label}")
                 await tabs.locator(f"span.tabs-title:has-text('{label}')").first.click(timeout=2000)
-                await asyncio.sleep(0.6)
                 print("  ✅ Tab clicked successfully")
                 return
-            except:
+            except PlaywrightTimeoutError:
                 continue
         print("  ⚠️ Could not activate decedent tab")
 
+    def _on_frame(self, frame):
+        """Resolve pending frame waiters that this attached/navigated frame satisfies."""
+        for matches, fut in list(self._frame_waiters):
+            if not fut.done() and matches(frame):
+                fut.set_result(frame)
+
+    def _on_frame_detached(self, frame):
+        """Forget cached lookups that resolved to a detached frame."""
+        for key in [k for k, f in self._frame_cache.items() if f is frame]:
+            del self._frame_cache[key]
+
+    async def _wait_for_frame(self, matches, frames, timeout: float):
+        """Return the first frame matching `matches`, waiting up to `timeout` seconds for frame events."""
+        for f in frames:
+            if matches(f):
+                return f
+        fut = asyncio.get_running_loop().create_future()
+        waiter = (matches, fut)
+        self._frame_waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            self._frame_waiters.remove(waiter)
+
     async def wait_for_frame_by_url_fragment(self, url_fragment: str, timeout: int = 60):
         """Wait for frame with URL containing fragment."""
         print(f"  ⏳ Waiting for frame with URL containing '{url_fragment}'...")
         start_time = time.time()
-        for i in range(timeout):
-            for f in self.page.frames:
-                if f.url and url_fragment in f.url:
-                    elapsed = time.time() - start_time
-                    print(f"  ✅ Found frame: {f.url} (after {elapsed:.1f}s)")
-                    return f
-            if i % 5 == 0:  # Log every 5 seconds
-                print(f"  ⏳ Still waiting for frame... ({i}s)")
-            await asyncio.sleep(1)
-        raise PlaywrightTimeoutError(f"Frame with URL fragment '{url_fragment}' not found within {timeout}s")
+        try:
+            f = await self._wait_for_frame(lambda f: bool(f.url) and url_fragment in f.url, self.page.frames, timeout)
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeoutError(f"Frame with URL fragment '{url_fragment}' not found within {timeout}s")
+        elapsed = time.time() - start_time
+        print(f"  ✅ Found frame: {f.url} (after {elapsed:.1f}s)")
+        return f
 
     async def wait_for_frame_by_name(self, name: str, timeout: float = 30000, parent_frame=None):
         """Wait for frame with specific name."""
+        key = (parent_frame, name)
+        cached = self._frame_cache.get(key)
+        if cached is not None and not cached.is_detached():
+            return cached
         print(f"  ⏳ Waiting for frame with name '{name}'...")
         start_time = time.time()
-        while (time.time() - start_time) * 1000 < timeout:
-            frames = parent_frame.child_frames if parent_frame else self.page.frames
-            for frame in frames:
-                if frame.name == name:
-                    elapsed = time.time() - start_time
-                    print(f"  ✅ Found frame: {frame.name} (after {elapsed:.1f}s)")
-                    return frame
-            await asyncio.sleep(0.1)
-        raise PlaywrightTimeoutError(f"Frame with name '{name}' not found within {timeout}ms")
+        frames = parent_frame.child_frames if parent_frame else self.page.frames
+        try:
+            frame = await self._wait_for_frame(
+                lambda f: f.name == name and (parent_frame is None or f.parent_frame == parent_frame),
+                frames,
+                timeout / 1000,
+            )
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeoutError(f"Frame with name '{name}' not found within {timeout}ms")
+        elapsed = time.time() - start_time
+        print(f"  ✅ Found frame: {frame.name} (after {elapsed:.1f}s)")
+        self._frame_cache[key] = frame
+        return frame
 
     # === NAVIGATION METHODS ===
+    async def _route_request(self, route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def block_static_resources(self):
+        """Abort images, fonts, media and analytics requests for the whole context."""
+        await self.context.route("**/*", self._route_request)
+
     async def goto_login(self, retries: int = 3):
         """Go to login page and click 'Login as Guest'."""
         for attempt in range(1, retries + 1):
@@ -336,7 +526,6 @@ class DelawareScraper:
                 print(f"🔐 Login attempt {attempt}/{retries}")
                 print(f"  🌐 Navigating to {self.base_url}")
                 await self.page.goto(self.base_url, timeout=60000)
-                await self.page.wait_for_timeout(1500)
                 
                 possible_selectors = [
                     "input[value=' Login as Guest ']",
@@ -349,8 +538,7 @@ class DelawareScraper:
                 for sel in possible_selectors:
                     try:
                         print(f"  🔍 Looking for login button with selector: {sel}")
-                        await self.page.wait_for_selector(sel, timeout=5000)
-                        await self.page.locator(sel).click()
+                        await self.page.locator(sel).first.click(timeout=5000)
                         clicked = True
                         print(f"  ✅ Clicked login button with selector: {sel}")
                         break
@@ -372,14 +560,14 @@ class DelawareScraper:
                     print("💥 All login attempts failed")
                     raise
                 print("🔄 Retrying login...")
-                await asyncio.sleep(3)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def accept_terms(self, retries: int = 3):
         """Accept terms and conditions."""
         for attempt in range(1, retries + 1):
             try:
                 print(f"  📝 Accepting terms (attempt {attempt})")
-                await asyncio.sleep(1)
+                await self.page.wait_for_load_state("domcontentloaded")
                 iframe_selectors = [
                     "iframe[name='bodyframe']",
                     "iframe#bodyframe",
@@ -393,8 +581,7 @@ class DelawareScraper:
                         print(f"    🔍 Trying iframe: {ifsel}")
                         frame_locator = self.page.frame_locator(ifsel)
                         accept = frame_locator.locator("#accept")
-                        await accept.wait_for(state="visible", timeout=10000)
-                        await accept.click()
+                        await accept.click(timeout=10000)
                         clicked = True
                         print(f"    ✅ Accepted terms in iframe: {ifsel}")
                         break
@@ -426,18 +613,16 @@ class DelawareScraper:
                 if attempt == retries:
                     print("💥 All terms acceptance attempts failed")
                     raise
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def click_search_public_records(self, retries: int = 3):
         """Click Search Public Records."""
         for attempt in range(1, retries + 1):
             try:
                 print(f"  🔍 Clicking 'Search Public Records' (attempt {attempt})")
-                await self.page.wait_for_timeout(1000)
                 frame_locator = self.page.frame_locator("iframe[name='bodyframe']")
                 selector = "#datagrid-row-r1-2-0"
-                await frame_locator.locator(selector).wait_for(state="visible", timeout=20000)
-                await frame_locator.locator(selector).click()
+                await frame_locator.locator(selector).click(timeout=20000)
                 print("✅ Successfully clicked 'Search Public Records'")
                 return
             except Exception as e:
@@ -445,7 +630,7 @@ class DelawareScraper:
                 if attempt == retries:
                     print("💥 All search click attempts failed")
                     raise
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def enter_filing_dates(self, from_date: str, to_date: str, retries: int = 3):
         """Enter filing date range."""
@@ -454,9 +639,6 @@ class DelawareScraper:
         for attempt in range(1, retries + 1):
             try:
                 print(f"  🔄 Entering dates (attempt {attempt})")
-                print("  ⏳ Waiting for dynamic frames to load...")
-                await asyncio.sleep(3)
-
                 criteria_frame = None
                 try:
                     criteria_frame = await self.wait_for_frame_by_url_fragment("dynCriteria.do", timeout=30)
@@ -469,23 +651,17 @@ class DelawareScraper:
                 if not criteria_frame:
                     raise PlaywrightTimeoutError("Could not find criteria frame (dynCriteria.do or blank.jsp)")
 
-                await criteria_frame.wait_for_load_state("domcontentloaded", timeout=15000)
-                await asyncio.sleep(1)
-
-                el = await criteria_frame.wait_for_selector("#elemDateRange", timeout=15000)
-                if not el:
-                    raise PlaywrightTimeoutError("Date range container '#elemDateRange' not found")
-
-                from_input = await criteria_frame.wait_for_selector("#_easyui_textbox_input7", timeout=10000)
-                to_input = await criteria_frame.wait_for_selector("#_easyui_textbox_input8", timeout=10000)
+                # Locators auto-wait for the EasyUI date inputs; fill() retries until they accept input
+                from_input = criteria_frame.locator("#_easyui_textbox_input7")
+                to_input = criteria_frame.locator("#_easyui_textbox_input8")
 
                 print("  ⌨️ Filling from date...")
-                await from_input.fill("")
-                await from_input.type(from_date)
+                await from_input.fill(from_date, timeout=15000)
+                await from_input.dispatch_event("change")
                 
                 print("  ⌨️ Filling to date...")
-                await to_input.fill("")
-                await to_input.type(to_date)
+                await to_input.fill(to_date, timeout=10000)
+                await to_input.dispatch_event("change")
 
                 print(f"✅ Date range entered: {from_date} to {to_date}")
                 return
@@ -495,7 +671,7 @@ class DelawareScraper:
                 if attempt == retries:
                     print("💥 All date entry attempts failed")
                     raise
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def click_search_button(self, retries: int = 3):
         """Click search button."""
@@ -504,10 +680,8 @@ class DelawareScraper:
                 print(f"  🔍 Clicking search button (attempt {attempt})")
                 body_frame = await self.wait_for_frame_by_name("bodyframe", timeout=30000)
                 dyn_search_frame = await self.wait_for_frame_by_name("dynSearchFrame", timeout=30000, parent_frame=body_frame)
-                await dyn_search_frame.wait_for_load_state("domcontentloaded", timeout=15000)
                 search_selector = "a[onclick*='executeSearchCommand'][onclick*='search']"
-                await dyn_search_frame.wait_for_selector(search_selector, timeout=15000)
-                await dyn_search_frame.eval_on_selector(search_selector, "el => el.click()")
+                await dyn_search_frame.locator(search_selector).first.dispatch_event("click", timeout=15000)
                 print("✅ Search button clicked successfully")
                 return True
             except Exception as e:
@@ -515,7 +689,7 @@ class DelawareScraper:
                 if attempt == retries:
                     print("💥 All search button attempts failed")
                     return False
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     # === EXTRACTION METHODS ===
     async def extract_decedent_info_atomic(self):
@@ -524,75 +698,27 @@ class DelawareScraper:
         loc = self._doc_loc()
         await self.ensure_decedent_tab()
 
-        # Extract filing date
-        filing_date = ""
+        # One in-frame evaluate waits up to 15s for the filing date and reads every field;
+        # retried only if the frame reloads underneath it
+        fields = {}
         print("  🔍 Extracting filing date...")
-        for i in range(30):
-            try:
-                fd_cell = loc.locator("#fieldFILING_DATEspan").locator("xpath=ancestor::tr/td[3]").first
-                txt = await fd_cell.text_content()
-                if txt and txt.strip():
-                    filing_date = txt.strip()
-                    print(f"  ✅ Filing date: {filing_date}")
-                    break
-            except:
-                pass
-            if i % 10 == 0 and i > 0:
-                print(f"  ⏳ Still waiting for filing date... ({i}/30)")
-            await asyncio.sleep(0.5)
-
-        # Extract case file number
-        case_file_no = ""
-        try:
-            print("  🔍 Extracting case file number...")
-            cf_cell = loc.locator("#fieldCASENUMBERspan").locator("xpath=ancestor::tr/td[3]").first
-            case_file_no = (await cf_cell.text_content() or "").strip()
-            print(f"  ✅ Case file number: {case_file_no}")
-        except:
-            print("  ❌ Could not extract case file number")
-
-        # Extract address components
-        addr = city = state = zipc = ""
-
-        # Street Address
-        try:
-            print("  🔍 Extracting street address...")
-            addr_cell = loc.locator("#fcaddrCORESPONDENT_ADDRESSspan").locator("xpath=ancestor::tr/td[3]").first
-            addr = (await addr_cell.text_content() or "").strip()
-            print(f"  ✅ Street address: {addr}")
-        except:
-            print("  ❌ Could not extract street address")
-
-        # City
-        try:
-            print("  🔍 Extracting city...")
-            city_cell = loc.locator("#fccityCORESPONDENT_ADDRESSspan").locator("xpath=ancestor::tr/td[3]").first
-            city = (await city_cell.text_content() or "").strip()
-            print(f"  ✅ City: {city}")
-        except:
-            print("  ❌ Could not extract city")
-
-        # State + ZIP (nested table)
-        try:
-            print("  🔍 Extracting state and ZIP...")
-            state_zip_cell = loc.locator("#fcstateCORESPONDENT_ADDRESSspan").locator("xpath=ancestor::tr/td[3]").first
-            state_locator = state_zip_cell.locator("table tr td").nth(0)
-            zip_locator = state_zip_cell.locator("table tr td").nth(2)
-            state = ((await state_locator.text_content()) or "").strip()
-            zipc = ((await zip_locator.text_content()) or "").strip()
-            print(f"  ✅ State: {state}, ZIP: {zipc}")
-        except Exception as e:
-            print(f"  ⚠️ Could not extract state/zip (primary): {e}")
-
-        # Fallback ZIP extraction
-        if not zipc:
+        for i in range(3):
             try:
-                print("  🔍 Trying fallback ZIP extraction...")
-                zip_fallback = loc.locator("xpath=//span[@id='fczipCORESPONDENT_ADDRESSspan']/ancestor::td[1]/following-sibling::td[1]").first
-                zipc = ((await zip_fallback.text_content()) or "").strip()
-                print(f"  ✅ Fallback ZIP: {zipc}")
+                fields = await loc.locator("body").first.evaluate(DECEDENT_FIELDS_JS, 15000)
+                break
             except Exception as e:
-                print(f"  ❌ Fallback zip extraction failed: {e}")
+                print(f"  ⚠️ Decedent field read failed (attempt {i + 1}/3): {e}")
+        if fields.get("filing_date"):
+            print(f"  ✅ Filing date: {fields['filing_date']}")
+        else:
+            print("  ⚠️ Filing date did not render")
+
+        filing_date = fields.get("filing_date", "")
+        case_file_no = fields.get("case_file_no", "")
+        addr, city = fields.get("addr", ""), fields.get("city", "")
+        state, zipc = fields.get("state", ""), fields.get("zip", "")
+        print(f"  ✅ Case file number: {case_file_no}")
+        print(f"  ✅ Street address: {addr}, City: {city}, State: {state}, ZIP: {zipc}")
 
         # Combine address components
         parts = [p for p in [addr, city, state, zipc] if p]
@@ -610,29 +736,26 @@ class DelawareScraper:
         print("  👥 Extracting representatives information...")
         loc = self._doc_loc()
         
+        # Wait for the panel and read every row in one in-frame call
         try:
-            await loc.locator("text=Personal Representative").first.wait_for(timeout=4000)
-        except:
-            await loc.locator("tr.evenrow, tr.oddrow").first.wait_for(timeout=6000)
-
-        rows = await loc.locator("tr.evenrow, tr.oddrow").all_text_contents()
+            rows = await loc.locator("body").first.evaluate(REP_ROWS_JS, [REP_ROWS_SEL, 4000, 10000])
+        except Exception:
+            # The frame navigated mid-wait; fall back to auto-waiting locators
+            try:
+                await loc.locator("text=Personal Representative").first.wait_for(timeout=4000)
+            except PlaywrightTimeoutError:
+                await loc.locator(REP_ROWS_SEL).first.wait_for(timeout=6000)
+            rows = await loc.locator(REP_ROWS_SEL).all_text_contents()
         print(f"  📊 Found {len(rows)} rows to process")
         
         reps = []
         current = {"name": "", "address": ""}
 
-        def looks_like_address(t: str) -> bool:
-            u = t.upper()
-            return any(ch.isdigit() for ch in t) or any(k in u for k in [
-                "AVE","ST","STREET","AVENUE","ROAD","RD","LANE","LN","DR","DRIVE",
-                "APT","SUITE","PO BOX","BLVD","COURT","CT"
-            ])
-
         for i, raw in enumerate(rows):
             t = raw.strip()
             if not t:
                 continue
-            if not looks_like_address(t) and len(t) < 120:
+            if not ADDRESS_HINT_RE.search(t) and len(t) < 120:
                 if current["name"]:
                     reps.append({
                         "representative_name": current["name"], 
@@ -654,75 +777,113 @@ class DelawareScraper:
         print(f"  ✅ Extracted {len(reps)} representatives")
         return reps
 
+    async def _extract_case_meta(self):
+        """Read caseFileId/caseFileNum from the document frame URL."""
+        try:
+            for f in self.page.frames:
+                url = f.url or ""
+                if "DocumentInfoView.jsp" in url and "caseFileId=" in url:
+                    return {"caseFileId": "", "caseFileNum": "", **{k: unquote_plus(v) for k, v in CASE_META_RE.findall(url)}}
+        except Exception as e:
+            print(f"    ❌ Case metadata error: {e}")
+        return {}
+
     async def safe_click_tab(self, tab_text, retries=3):
-        """Safely click a tab."""
+        """Safely click a tab: one in-frame JS call, then the locator fallbacks."""
         print(f"  🔄 Clicking tab: {tab_text}")
         tabs = self._tabs_loc()
         for attempt in range(retries):
+            # The text goes in as an argument, so quotes in it can't break the script
             try:
-                for sel in [
-                    f"span.tabs-title:has-text('{tab_text}')",
-                    f"li:has-text('{tab_text}') span.tabs-inner",
-                    f"li:has-text('{tab_text}')",
-                    f"span:has-text('{tab_text}')",
-                ]:
-                    try:
-                        await tabs.locator(sel).first.click(timeout=4000)
-                        print(f"  ✅ Successfully clicked tab: {tab_text}")
-                        return True
-                    except:
-                        continue
+                if await tabs.locator("body").evaluate(CLICK_TAB_JS, tab_text, timeout=4000):
+                    print(f"  ✅ Successfully clicked tab via JS: {tab_text}")
+                    return True
+            except Exception:
+                pass
 
-                # Fallback: JS click
+            for sel in [
+                f"span.tabs-title:has-text('{tab_text}')",
+                f"li:has-text('{tab_text}') span.tabs-inner",
+                f"li:has-text('{tab_text}')",
+                f"span:has-text('{tab_text}')",
+            ]:
                 try:
-                    await tabs.evaluate(f"""
-                        () => {{
-                            const spans = Array.from(document.querySelectorAll('span.tabs-title'));
-                            const t = spans.find(x => x.textContent.trim().includes('{tab_text}'));
-                            if (t) {{ t.click(); return true; }}
-                            const li = Array.from(document.querySelectorAll('li')).find(x => x.textContent.includes('{tab_text}'));
-                            if (li) {{ li.click(); return true; }}
-                            return false;
-                        }}
-                    """)
-                    print(f"  ✅ Successfully clicked tab via JS: {tab_text}")
+                    await tabs.locator(sel).first.click(timeout=4000)
+                    print(f"  ✅ Successfully clicked tab: {tab_text}")
                     return True
-                except:
-                    pass
-            except:
-                if attempt < retries - 1:
-                    print(f"  🔄 Retrying tab click... ({attempt + 1}/{retries})")
-                    await asyncio.sleep(0.8)
+                except Exception:
+                    continue
+
+            if attempt < retries - 1:
+                print(f"  🔄 Retrying tab click... ({attempt + 1}/{retries})")
+                await asyncio.sleep(backoff_delay(attempt, 0.25))
         print(f"  ❌ Failed to click tab: {tab_text}")
         return False
 
-    async def click_result_link_by_index(self, index: int) -> bool:
-        """Click result link by index."""
-        print(f"  🔗 Clicking result link at index {index}")
-        res = self._res_list_loc()
-
-        # Try primary selector
-        a = res.locator(f"a.link#inst{index}").first
-        if await a.count():
-            try:
-                await a.click(timeout=6000)
-                print(f"  ✅ Clicked result link using primary selector")
+    async def click_result_row(self, meta) -> bool:
+        """Click a result row (from collect_result_row_links) with one in-frame JS call."""
+        print(f"  🔗 Clicking result link at index {meta['index']} ({meta['id'] or 'no id'})")
+        try:
+            if await self._res_list_loc().locator("body").evaluate(CLICK_RESULT_ROW_JS, [meta, ROW_LINKS_SEL]):
+                print(f"  ✅ Clicked result link")
                 return True
-            except:
-                print(f"  ❌ Primary selector click failed")
+        except Exception as e:
+            print(f"  ❌ Result link click failed: {e}")
+            return False
 
-        # Fallback: Nth clickable link
-        all_links = res.locator("a.link[onclick*='loadRecord']")
-        count = await all_links.count()
-        if count > index:
-            try:
-                await all_links.nth(index).click(timeout=6000)
-                print(f"  ✅ Clicked result link using fallback selector ({count} links found)")
-                return True
-            except:
-                print(f"  ❌ Fallback selector click failed")
+        print(f"  ❌ Could not click result link at index {meta['index']}")
+        return False
+
+    async def collect_result_row_links(self, timeout: int = 15000):
+        """Wait for the result rows and read every row's link metadata in one call."""
+        links = self._row_links_loc()
+        await links.first.wait_for(state="attached", timeout=timeout)
+        row_metas = await links.evaluate_all(
+            "els => els.map((a, i) => ({index: i, id: a.id, onclick: a.getAttribute('onclick') || ''}))"
+        )
+        for meta in row_metas:
+            m = LOAD_RECORD_RE.search(meta["onclick"])
+            meta["caseFileId"], meta["caseFileNum"] = m.groups() if m else ("", "")
+        return row_metas
+
+    @staticmethod
+    def _row_key(meta) -> str:
+        """Identity of a result row across pages (caseFileId, else its onclick)."""
+        return meta["caseFileId"] or meta["onclick"]
+
+    async def _click_back_button(self, resnavframe) -> bool:
+        """Click the 'Back to Results' control in resnavframe."""
+        # One locator over all known variants: whichever renders first is clicked,
+        # instead of letting each missing variant burn its own timeout
+        try:
+            await resnavframe.locator(BACK_BUTTON_SEL).first.click(timeout=3000)
+            print("    ✅ Clicked back button")
+            return True
+        except Exception:
+            pass
 
-        print(f"  ❌ Could not click result link at index {index}")
+        try:
+            if await resnavframe.evaluate("""
+                () => {
+                    const elements = Array.from(document.querySelectorAll('a, img'));
+                    const backElement = elements.find(el =>
+                        el.textContent.includes('Back to Results') ||
+                        el.alt === 'Back to Results' ||
+                        (el.onclick && el.onclick.toString().includes('results'))
+                    );
+                    if (backElement) {
+                        if (backElement.onclick) backElement.onclick();
+                        else if (backElement.parentElement && backElement.parentElement.onclick) backElement.parentElement.onclick();
+                        else backElement.click();
+                        return true;
+                    }
+                    return false;
+                }
+            """):
+                print("    ✅ Clicked back button via JavaScript")
+                return True
+        except Exception:
+            pass
         return False
 
     async def click_back_to_results(self, retries=5):
@@ -730,97 +891,79 @@ class DelawareScraper:
         print("  🔙 Returning to results page...")
         for attempt in range(retries):
             try:
-                await asyncio.sleep(0.8)
                 bodyframe = await self.wait_for_frame_by_name("bodyframe", 10000)
 
-                resnavframe = None
-                for i in range(10):
-                    for f in bodyframe.child_frames:
-                        if f.name == "resnavframe":
-                            resnavframe = f
-                            break
-                    if resnavframe:
-                        break
-                    if i % 3 == 0:
-                        print(f"    ⏳ Still searching for resnavframe... ({i}/10)")
-                    await asyncio.sleep(0.3)
+                try:
+                    resnavframe = await self.wait_for_frame_by_name("resnavframe", 3000, parent_frame=bodyframe)
+                except PlaywrightTimeoutError:
+                    resnavframe = None
 
                 if not resnavframe:
                     resnavframe = await self.wait_for_frame_by_url_fragment("navbar.do?page=search.details", 10)
 
-                await resnavframe.wait_for_load_state("domcontentloaded", timeout=10000)
-                await asyncio.sleep(0.5)
-
+                # Arm the navigation listener before clicking so the reload can't be missed
                 clicked = False
-                for sel in [
-                    "text='Back to Results'",
-                    "a[onclick*='executeSearchNav'][onclick*='results']",
-                    "img[alt='Back to Results']",
-                ]:
-                    try:
-                        await resnavframe.click(sel, timeout=3000)
-                        clicked = True
-                        print(f"    ✅ Clicked back button with selector: {sel}")
-                        break
-                    except:
+                try:
+                    async with self.page.expect_event(
+                        "framenavigated",
+                        predicate=lambda f: "SearchResultsView.jsp" in (f.url or ""),
+                        timeout=10000,
+                    ):
+                        clicked = await self._click_back_button(resnavframe)
+                        if not clicked:
+                            raise PlaywrightTimeoutError("Back to Results control not found")
+                except PlaywrightTimeoutError:
+                    if not clicked:
+                        print(f"  ⚠️ Could not find back button, attempt {attempt + 1}")
                         continue
+                    # No navigation event seen; the results frame may have been reused.
+                    # The rows below are the signal either way, so don't wait on the frame URL too.
+                    print(f"  ⚠️ No results navigation seen after Back, checking for rows (attempt {attempt + 1})")
 
-                if not clicked:
-                    try:
-                        await resnavframe.evaluate("""
-                            () => {
-                                const elements = Array.from(document.querySelectorAll('a, img'));
-                                const backElement = elements.find(el =>
-                                    el.textContent.includes('Back to Results') ||
-                                    el.alt === 'Back to Results' ||
-                                    (el.onclick && el.onclick.toString().includes('results'))
-                                );
-                                if (backElement) {
-                                    if (backElement.onclick) backElement.onclick();
-                                    else if (backElement.parentElement && backElement.parentElement.onclick) backElement.parentElement.onclick();
-                                    else backElement.click();
-                                    return true;
-                                }
-                                return false;
-                            }
-                        """)
-                        clicked = True
-                        print("    ✅ Clicked back button via JavaScript")
-                    except:
-                        pass
+                # The results frame reloads before its list; wait for the rows themselves.
+                # The detail view has no result list, so rows can only come from the reloaded results.
+                await self._row_links_loc().first.wait_for(state="attached", timeout=15000)
 
-                if clicked:
-                    await asyncio.sleep(1.2)
-                    try:
-                        await self.wait_for_frame_by_name("bodyframe", 5000)
-                        await self.wait_for_frame_by_url_fragment("SearchResultsView.jsp", 5)
-                        print("  ✅ Successfully returned to results page")
-                        return True
-                    except:
-                        print(f"  ⚠️ Back button clicked but results verification failed, attempt {attempt + 1}")
-                        continue
-                else:
-                    print(f"  ⚠️ Could not find back button, attempt {attempt + 1}")
+                print("  ✅ Successfully returned to results page")
+                return True
 
             except Exception as e:
                 print(f"  ❌ Back to results attempt {attempt + 1} failed: {e}")
                 if attempt < retries - 1:
-                    await asyncio.sleep(1.2)
+                    await asyncio.sleep(backoff_delay(attempt, 0.4))
                 continue
 
         print("  ❌ Failed to return to results after all attempts")
         return False
 
+    def _expect_results_reload(self, timeout: int):
+        """Start listening for the results frames to navigate; arm before triggering it."""
+        return asyncio.ensure_future(self.page.wait_for_event(
+            "framenavigated",
+            predicate=lambda f: f.name in ("resultFrame", "resultListFrame"),
+            timeout=timeout,
+        ))
+
+    async def _wait_results_reloaded(self, nav, timeout: int):
+        """Wait for an armed results reload, then for the new list's row links."""
+        try:
+            await nav
+        except PlaywrightTimeoutError:
+            print("⚠ Results frame did not navigate; checking the current list")
+        await self._row_links_loc().first.wait_for(timeout=timeout)
+
     async def goto_results_page(self, page_number: int, wait_timeout: int = 20000) -> bool:
         """Navigate to specific results page."""
         print(f"  🔄 Navigating to page {page_number}")
         
+        nav = None
         # First try the known subnav locator
         try:
             subnav = self._res_subnav_middle_loc()
             input_locator = subnav.locator("input[name='pageNumber']").first
             await input_locator.wait_for(state="attached", timeout=6000)
             await input_locator.fill(str(page_number))
+            nav = self._expect_results_reload(wait_timeout)
 
             go_link = subnav.locator("a[onclick*='goToResultPage'], a[onclick*='goToResultPage()']").first
             if await go_link.count():
@@ -828,19 +971,19 @@ class DelawareScraper:
                     await go_link.click()
                     print("  ✅ Clicked Go link")
                 except Exception:
-                    await subnav.evaluate("() => { if (window.goToResultPage) goToResultPage(); }")
+                    await subnav.locator("body").evaluate(GO_TO_RESULT_PAGE_JS)
                     print("  ✅ Executed Go function via JavaScript")
             else:
-                await subnav.evaluate("() => { if (window.goToResultPage) goToResultPage(); }")
+                await subnav.locator("body").evaluate(GO_TO_RESULT_PAGE_JS)
                 print("  ✅ Executed Go function via JavaScript (no link found)")
 
-            res = self._res_list_loc()
-            await res.locator("a.link#inst0, a.link[onclick*='loadRecord']").first.wait_for(timeout=wait_timeout)
-            await asyncio.sleep(0.6)
+            await self._wait_results_reloaded(nav, wait_timeout)
             print(f"  ✅ Successfully navigated to page {page_number}")
             return True
 
         except Exception as fast_err:
+            if nav is not None:
+                nav.cancel()
             print(f"  ⚠️ Fast path navigation failed: {fast_err}")
 
         # Fallback: search frames for pageNumber input
@@ -848,7 +991,7 @@ class DelawareScraper:
             print("  🔄 Trying fallback navigation...")
             input_frame = None
             input_element = None
-
+            # The pager frame navigates on every page change, so handles are found afresh each time
             for f in self.page.frames:
                 try:
                     handles = await f.query_selector_all("input[name='pageNumber']")
@@ -865,25 +1008,11 @@ class DelawareScraper:
                 return False
 
             await input_element.fill(str(page_number))
+            nav = self._expect_results_reload(wait_timeout)
             print("  ✅ Filled page number in fallback input")
 
             try:
-                result = await input_frame.evaluate(
-                    """() => {
-                        try {
-                            if (typeof goToResultPage === 'function') { goToResultPage(); return true; }
-                            if (window.goToResultPage) { window.goToResultPage(); return true; }
-                            const goBtn = Array.from(document.querySelectorAll('a, input, button')).find(el =>
-                                (el.getAttribute && (el.getAttribute('onclick') || '').includes('goToResultPage')) ||
-                                (el.textContent && /go\s*to\s*result/i.test(el.textContent))
-                            );
-                            if (goBtn) { goBtn.click(); return true; }
-                            return false;
-                        } catch (e) {
-                            return false;
-                        }
-                    }"""
-                )
+                result = await input_frame.evaluate(GO_TO_RESULT_PAGE_JS)
                 if not result:
                     print("  ⚠️ JS navigation did not report success")
                 else:
@@ -892,9 +1021,7 @@ class DelawareScraper:
                 print(f"  ⚠️ JS evaluation failed: {eval_err}")
 
             try:
-                res = self._res_list_loc()
-                await res.locator("a.link#inst0, a.link[onclick*='loadRecord']").first.wait_for(timeout=wait_timeout)
-                await asyncio.sleep(0.6)
+                await self._wait_results_reloaded(nav, wait_timeout)
                 print(f"  ✅ Successfully navigated to page {page_number} (fallback)")
                 return True
             except Exception as wait_err:
@@ -924,44 +1051,64 @@ class DelawareScraper:
         
         # Wait for results
         print("⏳ Waiting for search results to load...")
-        await asyncio.sleep(10)
+        try:
+            row_metas = await self.collect_result_row_links(timeout=60000)
+        except PlaywrightTimeoutError:
+            print("📭 No search results appeared for this date")
+            return all_records
 
         max_pages = 10  # Reasonable limit for single day
         page_index = 1
-        
+        seen = set()
+
         while page_index <= max_pages:
             print(f"\n📄 PROCESSING PAGE {page_index}/{max_pages}")
 
-            # Wait for results list with retries
-            for retry in range(5):
+            # Page 1's rows were read when the search results appeared; later pages
+            # wait for the results list (the locator keeps retrying) and read all row metadata at once
+            if page_index > 1:
                 try:
                     print(f"  🔍 Waiting for results on page {page_index}...")
-                    await self._res_list_loc().locator("a.link#inst0, a.link[onclick*='loadRecord']").first.wait_for(timeout=15000)
-                    print(f"  ✅ Results loaded on page {page_index}")
-                    break
+                    row_metas = await self.collect_result_row_links(timeout=75000)
                 except Exception as e:
-                    if retry == 4:
-                        print(f"❌ No results found on page {page_index} after 5 retries")
-                        return all_records
-                    print(f"🔄 Retry {retry + 1}/5 for page {page_index} loading...")
-                    await asyncio.sleep(2)
+                    print(f"❌ No results found on page {page_index}: {e}")
+                    return all_records
+            print(f"  ✅ Results loaded on page {page_index}: {len(row_metas)} rows")
+
+            # Stop if pagination handed back the page we just processed
+            ids = {self._row_key(m) for m in row_metas}
+            if ids and ids == self._prev_page_ids:
+                print(f"⏹️ Page {page_index} repeats the previous page, stopping")
+                break
+            self._prev_page_ids = ids
+
+            # Skip rows already scraped on an earlier page (repeats at page boundaries)
+            fresh_metas = [m for m in row_metas if not self._row_key(m) or self._row_key(m) not in seen]
+            if len(fresh_metas) < len(row_metas):
+                print(f"  ⏭️ Skipping {len(row_metas) - len(fresh_metas)} rows already scraped")
+            row_metas = fresh_metas
+            seen.update(self._row_key(m) for m in row_metas if self._row_key(m))
 
             processed_this_page = 0
             consecutive_misses = 0
             page_records = []
 
             # Process records on current page
-            for row_idx in range(40):
-                print(f"  📝 Processing record {row_idx + 1}/40 on page {page_index}")
+            for row_idx, meta in enumerate(row_metas):
+                print(f"  📝 Processing record {row_idx + 1}/{len(row_metas)} on page {page_index}")
 
                 # Click record link with retries
                 success = False
                 for retry in range(3):
-                    success = await self.click_result_link_by_index(row_idx)
+                    success = await self.click_result_row(meta)
                     if success:
                         break
                     print(f"    🔄 Retry {retry + 1}/3 for clicking record...")
-                    await asyncio.sleep(1)
+                    # A failed click usually means the list is still reloading; wait for its rows
+                    try:
+                        await self._row_links_loc().first.wait_for(state="attached", timeout=5000)
+                    except PlaywrightTimeoutError:
+                        pass
                 
                 if not success:
                     print(f"  ❌ Could not click record {row_idx + 1}")
@@ -971,56 +1118,39 @@ class DelawareScraper:
                         break
                     continue
 
-                # Wait for document details with retries
+                # Wait for document details
                 doc_loaded = False
-                for retry in range(3):
-                    try:
-                        print(f"    ⏳ Waiting for document details (retry {retry + 1})...")
-                        await self._doc_loc().locator("body").first.wait_for(state="attached", timeout=20000)
-                        await asyncio.sleep(1.0)
-                        doc_loaded = True
-                        print("    ✅ Document details loaded")
-                        break
-                    except Exception as e:
-                        if retry == 2:
-                            print(f"    ❌ Failed to load details for record {row_idx + 1}")
-                        await asyncio.sleep(1)
+                try:
+                    print("    ⏳ Waiting for document details...")
+                    await self._doc_loc().locator("body").first.wait_for(state="attached", timeout=60000)
+                    doc_loaded = True
+                    print("    ✅ Document details loaded")
+                except Exception as e:
+                    print(f"    ❌ Failed to load details for record {row_idx + 1}: {e}")
 
                 if not doc_loaded:
                     consecutive_misses += 1
                     continue
 
-                # Extract decedent info
-                dec_info = {}
-                try:
-                    dec_info = await self.extract_decedent_info_atomic()
-                except Exception as e:
-                    print(f"    ❌ Decedent extraction failed: {e}")
+                # Extract decedent info and case metadata concurrently
+                dec_info, case_meta = await asyncio.gather(
+                    self.extract_decedent_info_atomic(),
+                    self._extract_case_meta(),
+                    return_exceptions=True,
+                )
+                if isinstance(dec_info, Exception):
+                    print(f"    ❌ Decedent extraction failed: {dec_info}")
+                    dec_info = {}
 
                 # Extract representatives
                 reps = []
                 try:
                     clicked = await self.safe_click_tab("Representatives", retries=2)
                     if clicked:
-                        await asyncio.sleep(1.0)
                         reps = await self.extract_representatives_atomic()
                 except Exception as e:
                     print(f"    ❌ Representatives extraction failed: {e}")
 
-                # Get case metadata from URL
-                case_meta = {}
-                try:
-                    for f in self.page.frames:
-                        if f.url and "DocumentInfoView.jsp" in f.url and "caseFileId=" in f.url:
-                            qs = parse_qs(urlparse(f.url).query)
-                            case_meta = {
-                                "caseFileId": (qs.get("caseFileId") or [""])[0],
-                                "caseFileNum": (qs.get("caseFileNum") or [""])[0],
-                            }
-                            break
-                except Exception as e:
-                    print(f"    ❌ Case metadata error: {e}")
-
                 # Combine record data
                 base_record = {
                     "case_file_no": dec_info.get("case_file_no", ""),
@@ -1053,14 +1183,12 @@ class DelawareScraper:
                     if back_success:
                         break
                     print(f"    🔄 Retry {retry + 1}/3 for returning to results...")
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(backoff_delay(retry, 0.5))
                 
                 if not back_success:
                     print("❌ Failed to return to results, stopping page processing")
                     break
 
-                await asyncio.sleep(0.5)
-
             # Add page records to total
             all_records.extend(page_records)
             print(f"✅ Page {page_index} complete: {len(page_records)} records")
@@ -1075,14 +1203,13 @@ class DelawareScraper:
                     if next_success:
                         break
                     print(f"🔄 Retry {retry + 1}/3 for next page navigation...")
-                    await asyncio.sleep(2)
+                    await asyncio.sleep(backoff_delay(retry, 0.5))
                 
                 if not next_success:
                     print("❌ Failed to navigate to next page, stopping")
                     break
                 
                 page_index += 1
-                await asyncio.sleep(1.0)
             else:
                 break
 
@@ -1142,6 +1269,8 @@ async def main():
                     "--disable-dev-shm-usage",
                     "--no-sandbox",
                     "--disable-gpu",
+                    "--disable-renderer-backgrounding",
+                    "--disable-background-timer-throttling",
                     "--single-process"
                 ]
             )
@@ -1153,6 +1282,7 @@ async def main():
             
             page = await context.new_page()
             scraper = DelawareScraper(page, browser=browser, context=context)
+            await scraper.block_static_resources()
             
             try:
                 # Perform scraping workflow
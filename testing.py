@@ -1,22 +1,293 @@
 # scrape_delaware.py
 import asyncio
-import json
+import hashlib
 import os
+import random
+import time
 import traceback
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-import time
-from collections import defaultdict
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import unquote_plus
+import re
+import zipfile
+from itertools import count, groupby
+from operator import itemgetter
+from xml.sax.saxutils import escape as xml_escape
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+import orjson
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+import xlsxwriter
 
 OUT_DIR = Path("out")
 OUT_DIR.mkdir(exist_ok=True)
 
+DEFAULT_FROM_DATE = "01/01/2025"
+# Pool of logged-in browser contexts (one search session each) used to scrape result pages in parallel.
+# DELAWARE_WORKERS tunes the number of parallel sessions (lower it if the site rate-limits).
+POOL_MAX_SIZE = int(os.environ.get("DELAWARE_WORKERS") or os.environ.get("SCRAPER_POOL_MAX_SIZE", "8"))
+POOL_IDLE_TIMEOUT = float(os.environ.get("SCRAPER_POOL_IDLE_TIMEOUT", "600"))  # seconds
+# Tries per result page in the concurrent scrape before it is reported missing
+PAGE_ATTEMPTS = 3
+# Run Chrome headless (DELAWARE_HEADLESS=1); headed by default, as the scraper was tuned that way
+HEADLESS = os.environ.get("DELAWARE_HEADLESS") == "1"
+# Attach to an already running Chrome (started with --remote-debugging-port) instead of
+# launching one, so repeated runs skip the browser cold start
+CDP_URL = os.environ.get("DELAWARE_CDP_URL")
+# Log the requests behind the first record click, to look for a JSON/XML detail endpoint
+SNIFF_REQUESTS = os.environ.get("DELAWARE_SNIFF_REQUESTS") == "1"
+# Append to an existing all_records.ndjson and skip the cases it already holds
+RESUME = os.environ.get("DELAWARE_RESUME") == "1"
+# Stop once this many records have been scraped (unset: scrape every page)
+MAX_RECORDS = int(os.environ["DELAWARE_MAX_RECORDS"]) if os.environ.get("DELAWARE_MAX_RECORDS") else None
+# Dump page HTML and frame lists on failures (DELAWARE_DEBUG=1); off by default, page.content() is costly
+DEBUG_DUMPS = os.environ.get("DELAWARE_DEBUG") == "1"
+# At most two debug dumps at a time, so a burst of worker failures cannot pile up on disk
+DEBUG_DUMP_SLOTS = asyncio.Semaphore(2)
+
+# Requests the scraper never needs. Stylesheets stay: EasyUI panels and tabs rely on
+# CSS for visibility, and the locators wait for state="visible".
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "websocket"}
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+# onclick="loadRecord('<caseFileId>','<caseFileNum>',...)" on each result row
+LOAD_RECORD_RE = re.compile(r"loadRecord\('([^']*)'\s*,\s*'([^']*)'")
+# caseFileId/caseFileNum query parameters of the DocumentInfoView.jsp frame URL
+CASE_META_RE = re.compile(r"[?&](caseFileId|caseFileNum)=([^&#]+)")
+MDY_DATE_RE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})\s*$")
+# A representative row is an address if it has a digit or a street word
+ADDRESS_HINT_RE = re.compile(
+    r"\d|\b(?:AVE|ST|STREET|AVENUE|ROAD|RD|LANE|LN|DR|DRIVE|APT|SUITE|PO BOX|BLVD|COURT|CT)\b",
+    re.IGNORECASE,
+)
+
+# Column order of every month sheet in the XLSX export
+XLSX_HEADERS = ("case_file_no", "filing_date", "caseFileNum", "caseFileId",
+                "decedent_address", "representative_name", "representative_address")
+# Exports with at least this many records skip XlsxWriter and write the sheet XML directly
+XLSX_FAST_MIN_ROWS = int(os.environ.get("DELAWARE_XLSX_FAST_MIN_ROWS", "20000"))
+# Deflate level for the direct-XML writer: level 1 trims the compression step
+# (60k rows: 0.93s vs 1.12s at the default 6) for a ~15% larger file
+XLSX_COMPRESSLEVEL = 1
+# Control characters that are not allowed in XML 1.0 (Excel rejects the file if they appear raw).
+# A precompiled regex beats a str.translate deletion table here (~5x on address-sized values).
+XML_ILLEGAL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+XLSX_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{overrides}</Types>'
+)
+XLSX_SHEET_OVERRIDE_XML = (
+    '<Override PartName="/xl/worksheets/sheet{n}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+XLSX_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+XLSX_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets></workbook>'
+)
+XLSX_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{rels}</Relationships>'
+)
+XLSX_WORKBOOK_REL_XML = (
+    '<Relationship Id="rId{n}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{n}.xml"/>'
+)
+XLSX_SHEET_HEAD_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<cols>{cols}</cols><sheetData>'
+)
+XLSX_SHEET_TAIL_XML = '</sheetData></worksheet>'
+
+# Record links in resultListFrame, one per result row
+ROW_LINKS_SEL = "a.link[id^='inst'], a.link[onclick*='loadRecord']"
+# Striped data rows of the Representatives panel in docInfoFrame
+REP_ROWS_SEL = "tr.evenrow, tr.oddrow"
+# Every known form of the 'Back to Results' control in resnavframe
+BACK_BUTTON_SEL = (
+    ":text-is('Back to Results'), "
+    "a[onclick*='executeSearchNav'][onclick*='results'], "
+    "img[alt='Back to Results']"
+)
+
+# Clicks a collected result row inside resultListFrame: by id, else by position in the list
+CLICK_RESULT_ROW_JS = """
+(body, [meta, rowLinksSel]) => {
+    const a = (meta.id && document.getElementById(meta.id))
+        || document.querySelectorAll(rowLinksSel)[meta.index];
+    if (!a) return false;
+    a.click();
+    return true;
+}
+"""
+
+# Waits inside docInfoFrame for the Representatives panel and returns its row texts: as soon
+# as the header text shows, or once rows have been present past the header grace period
+REP_ROWS_JS = """
+async (body, [rowsSel, headerMs, timeoutMs]) => {
+    const start = Date.now();
+    const readRows = () => Array.from(document.querySelectorAll(rowsSel), r => r.textContent);
+    while (true) {
+        const elapsed = Date.now() - start;
+        const hasRows = document.querySelector(rowsSel) !== null;
+        if (document.body.innerText.includes("Personal Representative")
+                || (hasRows && elapsed > headerMs) || elapsed > timeoutMs) {
+            return readRows();
+        }
+        await new Promise(r => setTimeout(r, 100));
+    }
+}
+"""
+
+# Triggers the results pager inside the frame holding the pageNumber input: the page's own
+# goToResultPage(), else a Go control that calls it. Raw string for the \s in the regex.
+GO_TO_RESULT_PAGE_JS = r"""
+() => {
+    try {
+        if (typeof goToResultPage === 'function') { goToResultPage(); return true; }
+        const goBtn = Array.from(document.querySelectorAll('a, input, button')).find(el =>
+            (el.getAttribute && (el.getAttribute('onclick') || '').includes('goToResultPage')) ||
+            (el.textContent && /go\s*to\s*result/i.test(el.textContent))
+        );
+        if (goBtn) { goBtn.click(); return true; }
+        return false;
+    } catch (e) {
+        return false;
+    }
+}
+"""
+
+# Clicks the EasyUI tab whose title contains the given text, inside the tabs frame
+CLICK_TAB_JS = """
+(body, text) => {
+    const span = Array.from(document.querySelectorAll("span.tabs-title"))
+        .find(x => x.textContent.trim().includes(text));
+    if (span) { span.click(); return true; }
+    const li = Array.from(document.querySelectorAll("li")).find(x => x.textContent.includes(text));
+    if (li) { li.click(); return true; }
+    return false;
+}
+"""
+
+# Reads the decedent fields inside docInfoFrame in one round trip, waiting in the frame for
+# the filing date to render. Each value is the third cell of the row holding the field's
+# label span (same XPath the locators used).
+DECEDENT_FIELDS_JS = """
+async (body, timeoutMs) => {
+    const first = (xpath, ctx) => document.evaluate(
+        xpath, ctx || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const text = (el) => ((el && el.textContent) || "").trim();
+    const field = (id) => {
+        const span = document.getElementById(id);
+        return span ? text(first("ancestor::tr/td[3]", span)) : "";
+    };
+    const read = () => {
+        // state and zip live in a nested table
+        const stSpan = document.getElementById("fcstateCORESPONDENT_ADDRESSspan");
+        const stRow = stSpan && first("ancestor::tr", stSpan);
+        const stCell = stRow && stRow.querySelectorAll("td")[2];
+        const nested = stCell ? stCell.querySelectorAll("table td") : [];
+        return {
+            filing_date: field("fieldFILING_DATEspan"),
+            case_file_no: field("fieldCASENUMBERspan"),
+            addr: field("fcaddrCORESPONDENT_ADDRESSspan"),
+            city: field("fccityCORESPONDENT_ADDRESSspan"),
+            state: text(nested[0]),
+            zip: text(nested[2]),
+        };
+    };
+    // Poll in the frame until the filing date renders, instead of one round trip per try
+    const start = Date.now();
+    let fields = read();
+    while (!fields.filing_date && Date.now() - start < timeoutMs) {
+        await new Promise(r => setTimeout(r, 100));
+        fields = read();
+    }
+    return fields;
+}
+"""
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """Seconds to wait before retry number attempt (0-based): doubling from base, plus jitter."""
+    return base * 2 ** attempt + random.random() * 0.1
+
+
+def _month_key(filing_date):
+    """Return the YYYY-MM sheet name for a MM/DD/YYYY (or MM/DD/YY) date, else 'Unknown'."""
+    m = MDY_DATE_RE.match(filing_date or "")
+    if not m:
+        return "Unknown"
+    month, day, year = map(int, m.groups())
+    if len(m.group(3)) == 2:
+        year += 2000 if year < 69 else 1900  # same pivot as strptime's %y
+    try:
+        date(year, month, day)
+    except ValueError:  # e.g. 13/01/2025 or 02/30/2025
+        return "Unknown"
+    return f"{year:04d}-{month:02d}"
+
+
+def _sheet_title(title):
+    """Fit a title into Excel's 31 chars, keeping long titles distinct with a short hash."""
+    if len(title) <= 31:
+        return title
+    return f"{title[:24]}_{hashlib.blake2b(title.encode(), digest_size=3).hexdigest()}"
+
+
+def _xml_safe_row(row):
+    """Row with XML-illegal control characters dropped, so both XLSX writers emit the same cells."""
+    if not XML_ILLEGAL_RE.search("".join(v for v in row if isinstance(v, str))):
+        return row
+    return tuple(XML_ILLEGAL_RE.sub("", v) if isinstance(v, str) else v for v in row)
+
+
+def _month_sheets(records):
+    """Yield (month, rows, widths) per YYYY-MM, rows in XLSX_HEADERS order."""
+    # Sort once by month key, then emit each month's sheet from contiguous groups
+    keyed = [(_month_key(r.get("filing_date")), r) for r in records]
+    keyed.sort(key=itemgetter(0))
+
+    headers = XLSX_HEADERS  # local name for the row loop
+    row_of = itemgetter(*headers)  # C-level lookup of all columns at once
+    for month, group in groupby(keyed, key=itemgetter(0)):
+        group = [r for _, r in group]
+        try:
+            rows = list(map(row_of, group))
+        except KeyError:
+            # Records from an older checkpoint may lack a column
+            rows = [tuple(r.get(h, "") for h in headers) for r in group]
+        rows = list(map(_xml_safe_row, rows))
+        widths = [
+            min(60, max(len(h), max(map(len, map(str, column)))) + 2)
+            for h, column in zip(headers, zip(*rows))
+        ]
+        yield _sheet_title(month), rows, widths
+
+
+def _xlsx_cell(value):
+    """Inline-string <c> element for one cell value."""
+    if value is None or value == "":
+        return "<c/>"
+    text = xml_escape(str(value))  # control characters already dropped by _month_sheets
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
 
 class DelawareScraper:
     def __init__(self, page, browser=None, context=None,
@@ -25,89 +296,148 @@ class DelawareScraper:
         self.browser = browser
         self.context = context
         self.base_url = base_url
+        self._frame_waiters = []
+        self._frame_cache = {}  # (parent_frame, name) -> Frame, dropped on framedetached
+        self._init_locators()
+        self.results_page = None  # results page currently displayed, if known
+        self._today = datetime.today().strftime("%m/%d/%Y")  # default Filing Date To
+        self.page.on("frameattached", self._on_frame)
+        self.page.on("framenavigated", self._on_frame)
+        self.page.on("framedetached", self._on_frame_detached)
 
     # === ADD THESE FRAME LOCATOR METHODS FROM WORKING CODE ===
-    def _res_list_loc(self):
+    def _init_locators(self):
+        """Build the frame locator chains once; they re-resolve lazily on every use."""
+        body = self.page.frame_locator("iframe[name='bodyframe']")
+        result = body.frame_locator("iframe[name='resultFrame']")
         # bodyframe -> resultFrame -> resultListFrame
-        return (
-            self.page
-            .frame_locator("iframe[name='bodyframe']")
-            .frame_locator("iframe[name='resultFrame']")
-            .frame_locator("iframe[name='resultListFrame']")
-        )
+        self._res_list = result.frame_locator("iframe[name='resultListFrame']")
+        # middle subnav with pageNumber input and Go button
+        self._res_subnav_middle = result.frame_locator("iframe[src*='navbar.do?page=search.resultNav.middle']")
+        # bodyframe -> documentFrame -> docInfoFrame
+        self._doc = body.frame_locator("iframe[name='documentFrame']").frame_locator("iframe[name='docInfoFrame']")
+        self._tabs = self._doc.frame_locator("iframe[name='tabs']")
+        self._row_links = self._res_list.locator(ROW_LINKS_SEL)
+
+    def _res_list_loc(self):
+        return self._res_list
+
+    def _row_links_loc(self):
+        return self._row_links
 
     def _res_subnav_middle_loc(self):
-        # middle subnav with pageNumber input and Go button
-        return (
-            self.page
-            .frame_locator("iframe[name='bodyframe']")
-            .frame_locator("iframe[name='resultFrame']")
-            .frame_locator("iframe[src*='navbar.do?page=search.resultNav.middle']")
-        )
+        return self._res_subnav_middle
 
     def _doc_loc(self):
-        # bodyframe -> documentFrame -> docInfoFrame
-        return (
-            self.page
-            .frame_locator("iframe[name='bodyframe']")
-            .frame_locator("iframe[name='documentFrame']")
-            .frame_locator("iframe[name='docInfoFrame']")
-        )
+        return self._doc
 
     def _tabs_loc(self):
-        return self._doc_loc().frame_locator("iframe[name='tabs']")
+        return self._tabs
 
     async def ensure_decedent_tab(self):
         """Ensure the decedent panel is visible."""
+        # The filing date field only shows while the decedent panel is the active tab
         try:
-            if await self._doc_loc().locator("text=Estate Info").first.is_visible():
+            if await self._doc_loc().locator("#fieldFILING_DATEspan").first.is_visible():
                 return
-        except:
+        except Exception:
             pass
-        
+
+        # One in-frame call per label; "Decedent" also matches "Decedent & Estate Info"
         tabs = self._tabs_loc()
+        for label in ["Decedent", "Estate Info"]:
+            try:
+                if await tabs.locator("body").evaluate(CLICK_TAB_JS, label, timeout=2000):
+                    return
+            except PlaywrightError:
+                break  # no tabs frame to click in, or it navigated/detached mid-call
+
         for label in ["Decedent & Estate Info", "Decedent", "Estate Info"]:
             try:
                 await tabs.locator(f"span.tabs-title:has-text('{label}')").first.click(timeout=2000)
-                await asyncio.sleep(0.6)
                 return
-            except:
+            except PlaywrightTimeoutError:
                 continue
 
     async def _dump_debug(self, name_prefix: str):
-        """Save HTML for debugging."""
-        ts = datetime.now().strftime("%Y%m%dT%H%M%SZ")
+        """Save HTML for debugging (only when DELAWARE_DEBUG=1)."""
+        if not DEBUG_DUMPS:
+            return
+        ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
         html = OUT_DIR / f"{name_prefix}-{ts}.html"
+        async with DEBUG_DUMP_SLOTS:
+            try:
+                html_content = await self.page.content()
+                # Write off the event loop so other pool sessions keep running
+                await asyncio.to_thread(html.write_text, html_content, encoding="utf-8")
+                print(f"Debug HTML dumped: {html}")
+            except Exception as e:
+                print("Failed to save HTML:", e)
+
+    def _print_frames(self, heading: str):
+        """List every frame URL (only when DELAWARE_DEBUG=1)."""
+        if not DEBUG_DUMPS:
+            return
+        print(heading)
+        for f in self.page.frames:
+            print(" ->", f.url)
+
+    def _on_frame(self, frame):
+        """Resolve pending frame waiters that this attached/navigated frame satisfies."""
+        for matches, fut in list(self._frame_waiters):
+            if not fut.done() and matches(frame):
+                fut.set_result(frame)
+
+    def _on_frame_detached(self, frame):
+        """Forget cached lookups that resolved to a detached frame."""
+        for key in [k for k, f in self._frame_cache.items() if f is frame]:
+            del self._frame_cache[key]
+
+    async def _wait_for_frame(self, matches, frames, timeout: float):
+        """Return the first frame matching `matches`, waiting up to `timeout` seconds for frame events."""
+        for f in frames:
+            if matches(f):
+                return f
+        fut = asyncio.get_running_loop().create_future()
+        waiter = (matches, fut)
+        self._frame_waiters.append(waiter)
         try:
-            html_content = await self.page.content()
-            html.write_text(html_content, encoding="utf-8")
-            print(f"Debug HTML dumped: {html}")
-        except Exception as e:
-            print("Failed to save HTML:", e)
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            self._frame_waiters.remove(waiter)
 
     async def wait_for_frame_by_url_fragment(self, url_fragment: str, timeout: int = 60):
         """
-        Poll the page.frames until a frame whose URL contains url_fragment appears.
+        Wait (event-driven) until a frame whose URL contains url_fragment appears.
         Returns the Frame object or raises TimeoutError.
         """
         print(f"Waiting for frame with url containing '{url_fragment}' (timeout {timeout}s)...")
-        for i in range(timeout):
-            for f in self.page.frames:
-                if f.url and url_fragment in f.url:
-                    print(f"Found frame with url {f.url}")
-                    return f
-            await asyncio.sleep(1)
-        raise PlaywrightTimeoutError(f"Frame with url fragment '{url_fragment}' not found within {timeout}s")
+        try:
+            f = await self._wait_for_frame(lambda f: bool(f.url) and url_fragment in f.url, self.page.frames, timeout)
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeoutError(f"Frame with url fragment '{url_fragment}' not found within {timeout}s")
+        print(f"Found frame with url {f.url}")
+        return f
 
     # -----------------------
     # Login / navigation (KEEP YOUR EXISTING METHODS)
     # -----------------------
+    async def _route_request(self, route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def block_static_resources(self):
+        """Abort images, fonts, media and analytics requests for the whole context."""
+        await self.context.route("**/*", self._route_request)
+
     async def goto_login(self, retries: int = 3):
         """Go to login page and click 'Login as Guest'."""
         for attempt in range(1, retries + 1):
             try:
                 await self.page.goto(self.base_url, timeout=60000)
-                await self.page.wait_for_timeout(1500)
                 possible_selectors = [
                     "input[value=' Login as Guest ']",
                     "input[value='Login as Guest']",
@@ -117,8 +447,7 @@ class DelawareScraper:
                 clicked = False
                 for sel in possible_selectors:
                     try:
-                        await self.page.wait_for_selector(sel, timeout=5000)
-                        await self.page.locator(sel).click()
+                        await self.page.locator(sel).first.click(timeout=5000)
                         clicked = True
                         break
                     except PlaywrightTimeoutError:
@@ -133,13 +462,13 @@ class DelawareScraper:
                 if attempt == retries:
                     await self._dump_debug("goto_login_failed")
                     raise
-                await asyncio.sleep(3)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def accept_terms(self, retries: int = 3):
         """Handle iframe and click Accept button using frame_locator."""
         for attempt in range(1, retries + 1):
             try:
-                await asyncio.sleep(1)
+                await self.page.wait_for_load_state("domcontentloaded")
                 iframe_selectors = [
                     "iframe[name='bodyframe']",
                     "iframe#bodyframe",
@@ -151,8 +480,7 @@ class DelawareScraper:
                     try:
                         frame_locator = self.page.frame_locator(ifsel)
                         accept = frame_locator.locator("#accept")
-                        await accept.wait_for(state="visible", timeout=10000)
-                        await accept.click()
+                        await accept.click(timeout=10000)
                         clicked = True
                         break
                     except PlaywrightTimeoutError:
@@ -178,22 +506,18 @@ class DelawareScraper:
             except Exception as e:
                 print(f"⚠ accept_terms attempt {attempt} failed: {e}")
                 if attempt == retries:
-                    print("Available frames (debug):")
-                    for f in self.page.frames:
-                        print(" -", f.url)
+                    self._print_frames("Available frames (debug):")
                     await self._dump_debug("accept_terms_failed")
                     raise
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def click_search_public_records(self, retries: int = 3):
         """Click the row that triggers Search Public Records."""
         for attempt in range(1, retries + 1):
             try:
-                await self.page.wait_for_timeout(1000)
                 frame_locator = self.page.frame_locator("iframe[name='bodyframe']")
                 selector = "#datagrid-row-r1-2-0"
-                await frame_locator.locator(selector).wait_for(state="visible", timeout=20000)
-                await frame_locator.locator(selector).click()
+                await frame_locator.locator(selector).click(timeout=20000)
                 print("✅ Clicked 'Search Public Records'")
                 return
             except Exception as e:
@@ -201,18 +525,13 @@ class DelawareScraper:
                 if attempt == retries:
                     await self._dump_debug("click_search_public_records_failed")
                     raise
-                print("Frames at failure:")
-                for f in self.page.frames:
-                    print(" →", f.url)
-                await asyncio.sleep(2)
+                self._print_frames("Frames at failure:")
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
-    async def enter_filing_dates(self, from_date: str = "01/01/2025", to_date: str = None, retries: int = 3):
+    async def enter_filing_dates(self, from_date: str = DEFAULT_FROM_DATE, to_date: str = None, retries: int = 3):
         """Fill Filing Date From/To in the dynamically-loaded criteriaframe."""
         if to_date is None:
-            to_date = datetime.today().strftime("%m/%d/%Y")
-
-        print("⏳ Waiting a few seconds for dynamic frames to load...")
-        await asyncio.sleep(3)
+            to_date = self._today
 
         for attempt in range(1, retries + 1):
             try:
@@ -228,22 +547,16 @@ class DelawareScraper:
                 if not criteria_frame:
                     raise PlaywrightTimeoutError("Could not find criteria frame (dynCriteria.do or blank.jsp)")
 
-                await criteria_frame.wait_for_load_state("domcontentloaded", timeout=15000)
-                await asyncio.sleep(1)
+                # Locators auto-wait for the EasyUI date inputs; fill() retries until they accept input
+                from_input = criteria_frame.locator("#_easyui_textbox_input7")
+                to_input = criteria_frame.locator("#_easyui_textbox_input8")
 
-                el = await criteria_frame.wait_for_selector("#elemDateRange", timeout=15000)
-                if not el:
-                    raise PlaywrightTimeoutError("Date range container '#elemDateRange' not found")
-
-                from_input = await criteria_frame.wait_for_selector("#_easyui_textbox_input7", timeout=10000)
-                to_input = await criteria_frame.wait_for_selector("#_easyui_textbox_input8", timeout=10000)
-
-                await from_input.fill("")
-                await from_input.type(from_date)
+                await from_input.fill(from_date, timeout=15000)
+                await from_input.dispatch_event("change")
                 print(f"✅ Entered FROM date: {from_date}")
 
-                await to_input.fill("")
-                await to_input.type(to_date)
+                await to_input.fill(to_date, timeout=10000)
+                await to_input.dispatch_event("change")
                 print(f"✅ Entered TO date: {to_date}")
 
                 return
@@ -251,12 +564,10 @@ class DelawareScraper:
             except Exception as e:
                 print(f"⚠ enter_filing_dates attempt {attempt} failed: {e}")
                 if attempt == retries:
-                    print("Frames (debug):")
-                    for f in self.page.frames:
-                        print(" ->", f.url)
+                    self._print_frames("Frames (debug):")
                     await self._dump_debug("enter_filing_dates_failed")
                     raise
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def click_search_button(self, retries: int = 3):
         """Click the 'Search Public Records' button."""
@@ -264,10 +575,8 @@ class DelawareScraper:
             try:
                 body_frame = await self.wait_for_frame_by_name("bodyframe", timeout=30000)
                 dyn_search_frame = await self.wait_for_frame_by_name("dynSearchFrame", timeout=30000, parent_frame=body_frame)
-                await dyn_search_frame.wait_for_load_state("domcontentloaded", timeout=15000)
                 search_selector = "a[onclick*='executeSearchCommand'][onclick*='search']"
-                await dyn_search_frame.wait_for_selector(search_selector, timeout=15000)
-                await dyn_search_frame.eval_on_selector(search_selector, "el => el.click()")
+                await dyn_search_frame.locator(search_selector).first.dispatch_event("click", timeout=15000)
                 print("✅ Clicked 'Search Public Records' button")
                 return True
             except Exception as e:
@@ -276,18 +585,25 @@ class DelawareScraper:
                     print("❌ All attempts to click search button failed")
                     await self._dump_debug("search_button_failed")
                     return False
-                await asyncio.sleep(2)
+                await asyncio.sleep(backoff_delay(attempt - 1, 1.0))
 
     async def wait_for_frame_by_name(self, name: str, timeout: float = 30000, parent_frame=None):
         """Wait for a frame with a specific name to be available."""
-        start_time = time.time()
-        while (time.time() - start_time) * 1000 < timeout:
-            frames = parent_frame.child_frames if parent_frame else self.page.frames
-            for frame in frames:
-                if frame.name == name:
-                    return frame
-            await asyncio.sleep(0.1)
-        raise PlaywrightTimeoutError(f"Frame with name '{name}' not found within {timeout}ms")
+        key = (parent_frame, name)
+        cached = self._frame_cache.get(key)
+        if cached is not None and not cached.is_detached():
+            return cached
+        frames = parent_frame.child_frames if parent_frame else self.page.frames
+        try:
+            frame = await self._wait_for_frame(
+                lambda f: f.name == name and (parent_frame is None or f.parent_frame == parent_frame),
+                frames,
+                timeout / 1000,
+            )
+        except asyncio.TimeoutError:
+            raise PlaywrightTimeoutError(f"Frame with name '{name}' not found within {timeout}ms")
+        self._frame_cache[key] = frame
+        return frame
 
     # === REPLACE WITH WORKING EXTRACTION METHODS ===
     async def extract_decedent_info_atomic(self):
@@ -297,51 +613,20 @@ class DelawareScraper:
         # Ensure correct tab is active
         await self.ensure_decedent_tab()
 
-        # Extract filing date
-        filing_date = ""
-        for _ in range(30):
+        # One in-frame evaluate waits up to 15s for the filing date and reads every field;
+        # retried only if the frame reloads underneath it
+        fields = {}
+        for _ in range(3):
             try:
-                fd_cell = loc.locator("#fieldFILING_DATEspan").locator("xpath=ancestor::tr/td[3]").first
-                txt = await fd_cell.text_content()
-                if txt and txt.strip():
-                    filing_date = txt.strip()
-                    break
-            except:
-                pass
-            await asyncio.sleep(0.5)
-
-        # Extract case file number
-        case_file_no = ""
-        try:
-            cf_cell = loc.locator("#fieldCASENUMBERspan").locator("xpath=ancestor::tr/td[3]").first
-            case_file_no = (await cf_cell.text_content() or "").strip()
-        except:
-            pass
-
-        # Extract address components
-        addr = city = state = zipc = ""
-
-        try:
-            addr_cell = loc.locator("#fcaddrCORESPONDENT_ADDRESSspan").locator("xpath=ancestor::tr/td[3]").first
-            addr = (await addr_cell.text_content() or "").strip()
-        except:
-            pass
-
-        try:
-            city_cell = loc.locator("#fccityCORESPONDENT_ADDRESSspan").locator("xpath=ancestor::tr/td[3]").first
-            city = (await city_cell.text_content() or "").strip()
-        except:
-            pass
+                fields = await loc.locator("body").first.evaluate(DECEDENT_FIELDS_JS, 15000)
+                break
+            except Exception:
+                continue
 
-        try:
-            # state and zip live in nested table
-            st_row = loc.locator("#fcstateCORESPONDENT_ADDRESSspan").locator("xpath=ancestor::tr").first
-            st_cell = st_row.locator("td").nth(2).locator("table td").nth(0)
-            zp_cell = st_row.locator("td").nth(2).locator("table td").nth(2)
-            state = ((await st_cell.text_content()) or "").strip()
-            zipc  = ((await zp_cell.text_content()) or "").strip()
-        except:
-            pass
+        filing_date = fields.get("filing_date", "")
+        case_file_no = fields.get("case_file_no", "")
+        addr, city = fields.get("addr", ""), fields.get("city", "")
+        state, zipc = fields.get("state", ""), fields.get("zip", "")
 
         parts = [p for p in [addr, city, state, zipc] if p]
         decedent_address = ", ".join(parts) if parts else ""
@@ -356,29 +641,24 @@ class DelawareScraper:
         """Extract representatives using stable frame locators."""
         loc = self._doc_loc()
         
-        # Wait for representatives content
+        # Wait for the panel and read every row in one in-frame call
         try:
-            await loc.locator("text=Personal Representative").first.wait_for(timeout=4000)
-        except:
-            await loc.locator("tr.evenrow, tr.oddrow").first.wait_for(timeout=6000)
-
-        # Extract representative data
-        rows = await loc.locator("tr.evenrow, tr.oddrow").all_text_contents()
+            rows = await loc.locator("body").first.evaluate(REP_ROWS_JS, [REP_ROWS_SEL, 4000, 10000])
+        except Exception:
+            # The frame navigated mid-wait; fall back to auto-waiting locators
+            try:
+                await loc.locator("text=Personal Representative").first.wait_for(timeout=4000)
+            except PlaywrightTimeoutError:
+                await loc.locator(REP_ROWS_SEL).first.wait_for(timeout=6000)
+            rows = await loc.locator(REP_ROWS_SEL).all_text_contents()
         reps = []
         current = {"name": "", "address": ""}
 
-        def looks_like_address(t: str) -> bool:
-            u = t.upper()
-            return any(ch.isdigit() for ch in t) or any(k in u for k in [
-                "AVE","ST","STREET","AVENUE","ROAD","RD","LANE","LN","DR","DRIVE",
-                "APT","SUITE","PO BOX","BLVD","COURT","CT"
-            ])
-
         for raw in rows:
             t = raw.strip()
             if not t:
                 continue
-            if not looks_like_address(t) and len(t) < 120:
+            if not ADDRESS_HINT_RE.search(t) and len(t) < 120:
                 if current["name"]:
                     reps.append({
                         "representative_name": current["name"], 
@@ -397,256 +677,350 @@ class DelawareScraper:
 
         return reps
 
+    async def _extract_case_meta(self):
+        """Read caseFileId/caseFileNum from the document frame URL."""
+        try:
+            for f in self.page.frames:
+                url = f.url or ""
+                if "DocumentInfoView.jsp" in url and "caseFileId=" in url:
+                    return {"caseFileId": "", "caseFileNum": "", **{k: unquote_plus(v) for k, v in CASE_META_RE.findall(url)}}
+        except Exception as e:
+            print(f"  ⚠ Case metadata error: {e}")
+        return {}
+
     async def safe_click_tab(self, tab_text, retries=3):
-        """Safely click a tab by text using frame locators."""
+        """Click a tab by its text: one in-frame JS call, then the locator fallbacks."""
         tabs = self._tabs_loc()
         for attempt in range(retries):
+            # The text goes in as an argument, so quotes in it can't break the script
             try:
-                for sel in [
-                    f"span.tabs-title:has-text('{tab_text}')",
-                    f"li:has-text('{tab_text}') span.tabs-inner",
-                    f"li:has-text('{tab_text}')",
-                    f"span:has-text('{tab_text}')",
-                ]:
-                    try:
-                        await tabs.locator(sel).first.click(timeout=4000)
-                        return True
-                    except:
-                        continue
+                if await tabs.locator("body").evaluate(CLICK_TAB_JS, tab_text, timeout=4000):
+                    return True
+            except Exception:
+                pass
 
-                # Fallback: JS click
+            for sel in [
+                f"span.tabs-title:has-text('{tab_text}')",
+                f"li:has-text('{tab_text}') span.tabs-inner",
+                f"li:has-text('{tab_text}')",
+                f"span:has-text('{tab_text}')",
+            ]:
                 try:
-                    await tabs.evaluate(f"""
-                        () => {{
-                            const spans = Array.from(document.querySelectorAll('span.tabs-title'));
-                            const t = spans.find(x => x.textContent.trim().includes('{tab_text}'));
-                            if (t) {{ t.click(); return true; }}
-                            const li = Array.from(document.querySelectorAll('li')).find(x => x.textContent.includes('{tab_text}'));
-                            if (li) {{ li.click(); return true; }}
-                            return false;
-                        }}
-                    """)
+                    await tabs.locator(sel).first.click(timeout=4000)
                     return True
-                except:
-                    pass
-            except:
-                if attempt < retries - 1:
-                    await asyncio.sleep(0.8)
+                except Exception:
+                    continue
+
+            if attempt < retries - 1:
+                await asyncio.sleep(backoff_delay(attempt, 0.25))
         return False
 
-    async def click_result_link_by_index(self, index: int) -> bool:
-        """Click row N on the current page using stable frame locators."""
-        res = self._res_list_loc()
+    async def click_result_row(self, meta) -> bool:
+        """Click a row from collect_result_row_links with a single in-frame JS call."""
+        try:
+            return await self._res_list_loc().locator("body").evaluate(CLICK_RESULT_ROW_JS, [meta, ROW_LINKS_SEL])
+        except Exception:
+            return False
 
-        # Try primary selector
-        a = res.locator(f"a.link#inst{index}").first
-        if await a.count():
-            try:
-                await a.click(timeout=6000)
-                return True
-            except:
-                pass
+    async def sniff_record_requests(self, meta, out_path: Path = OUT_DIR / "record_requests.json") -> bool:
+        """
+        Click a result row while logging the document/XHR requests it triggers.
+        The log shows whether the detail view is backed by an endpoint that could be
+        fetched directly instead of clicking through the frames.
+        """
+        captured = []
+
+        def on_request(request):
+            if request.resource_type in ("document", "xhr", "fetch"):
+                captured.append({
+                    "method": request.method,
+                    "type": request.resource_type,
+                    "url": request.url,
+                    "post_data": request.post_data,
+                })
+
+        self.page.on("request", on_request)
+        try:
+            clicked = await self.click_result_row(meta)
+            if clicked:
+                await self._doc_loc().locator("body").first.wait_for(state="attached", timeout=20000)
+        finally:
+            self.page.remove_listener("request", on_request)
+
+        out_path.write_bytes(orjson.dumps(captured, option=orjson.OPT_INDENT_2))
+        print(f"🔍 Logged {len(captured)} requests behind a record click: {out_path}")
+        return clicked
+
+    async def collect_result_row_links(self, timeout: int = 15000):
+        """Wait for the result rows and read every row's link metadata in one call."""
+        links = self._row_links_loc()
+        await links.first.wait_for(state="attached", timeout=timeout)
+        row_metas = await links.evaluate_all(
+            "els => els.map((a, i) => ({index: i, id: a.id, onclick: a.getAttribute('onclick') || ''}))"
+        )
+        for meta in row_metas:
+            m = LOAD_RECORD_RE.search(meta["onclick"])
+            meta["caseFileId"], meta["caseFileNum"] = m.groups() if m else ("", "")
+        return row_metas
+
+    @staticmethod
+    def _row_key(meta) -> str:
+        """Identity of a result row across pages (caseFileId, else its onclick)."""
+        return meta["caseFileId"] or meta["onclick"]
+
+    async def _click_back_button(self, resnavframe) -> bool:
+        """Click the 'Back to Results' control in resnavframe."""
+        # One locator over all known variants: whichever renders first is clicked,
+        # instead of letting each missing variant burn its own timeout
+        try:
+            await resnavframe.locator(BACK_BUTTON_SEL).first.click(timeout=3000)
+            return True
+        except Exception:
+            pass
 
-        # Fallback: Nth clickable link
-        all_links = res.locator("a.link[onclick*='loadRecord']")
-        if await all_links.count() > index:
-            try:
-                await all_links.nth(index).click(timeout=6000)
+        try:
+            if await resnavframe.evaluate("""
+                () => {
+                    const elements = Array.from(document.querySelectorAll('a, img'));
+                    const backElement = elements.find(el =>
+                        el.textContent.includes('Back to Results') ||
+                        el.alt === 'Back to Results' ||
+                        (el.onclick && el.onclick.toString().includes('results'))
+                    );
+                    if (backElement) {
+                        if (backElement.onclick) backElement.onclick();
+                        else if (backElement.parentElement && backElement.parentElement.onclick) backElement.parentElement.onclick();
+                        else backElement.click();
+                        return true;
+                    }
+                    return false;
+                }
+            """):
                 return True
-            except:
-                pass
-
+        except Exception:
+            pass
         return False
 
     async def click_back_to_results(self, retries=5):
         """Return to results page using working navigation."""
         for attempt in range(retries):
             try:
-                await asyncio.sleep(0.8)
                 bodyframe = await self.wait_for_frame_by_name("bodyframe", 10000)
 
-                resnavframe = None
-                for _ in range(10):
-                    for f in bodyframe.child_frames:
-                        if f.name == "resnavframe":
-                            resnavframe = f
-                            break
-                    if resnavframe:
-                        break
-                    await asyncio.sleep(0.3)
+                try:
+                    resnavframe = await self.wait_for_frame_by_name("resnavframe", 3000, parent_frame=bodyframe)
+                except PlaywrightTimeoutError:
+                    resnavframe = None
 
                 if not resnavframe:
                     resnavframe = await self.wait_for_frame_by_url_fragment("navbar.do?page=search.details", 10)
 
-                await resnavframe.wait_for_load_state("domcontentloaded", timeout=10000)
-                await asyncio.sleep(0.5)
-
+                # Arm the navigation listener before clicking so the reload can't be missed
                 clicked = False
-                for sel in [
-                    "text='Back to Results'",
-                    "a[onclick*='executeSearchNav'][onclick*='results']",
-                    "img[alt='Back to Results']",
-                ]:
-                    try:
-                        await resnavframe.click(sel, timeout=3000)
-                        clicked = True
-                        break
-                    except:
-                        pass
+                try:
+                    async with self.page.expect_event(
+                        "framenavigated",
+                        predicate=lambda f: "SearchResultsView.jsp" in (f.url or ""),
+                        timeout=10000,
+                    ):
+                        clicked = await self._click_back_button(resnavframe)
+                        if not clicked:
+                            raise PlaywrightTimeoutError("Back to Results control not found")
+                except PlaywrightTimeoutError:
+                    if not clicked:
+                        print(f"Could not find back button, attempt {attempt + 1}")
+                        continue
+                    # No navigation event seen; the results frame may have been reused.
+                    # The rows below are the signal either way, so don't wait on the frame URL too.
+                    print(f"No results navigation seen after Back, checking for rows (attempt {attempt + 1})")
 
-                if not clicked:
-                    try:
-                        await resnavframe.evaluate("""
-                            () => {
-                                const elements = Array.from(document.querySelectorAll('a, img'));
-                                const backElement = elements.find(el =>
-                                    el.textContent.includes('Back to Results') ||
-                                    el.alt === 'Back to Results' ||
-                                    (el.onclick && el.onclick.toString().includes('results'))
-                                );
-                                if (backElement) {
-                                    if (backElement.onclick) backElement.onclick();
-                                    else if (backElement.parentElement && backElement.parentElement.onclick) backElement.parentElement.onclick();
-                                    else backElement.click();
-                                    return true;
-                                }
-                                return false;
-                            }
-                        """)
-                        clicked = True
-                    except:
-                        pass
+                # The results frame reloads before its list; wait for the rows themselves.
+                # The detail view has no result list, so rows can only come from the reloaded results.
+                await self._row_links_loc().first.wait_for(state="attached", timeout=15000)
 
-                if clicked:
-                    await asyncio.sleep(1.2)
-                    try:
-                        await self.wait_for_frame_by_name("bodyframe", 5000)
-                        await self.wait_for_frame_by_url_fragment("SearchResultsView.jsp", 5)
-                        print("✅ Returned to results page")
-                        return True
-                    except:
-                        print(f"Back button clicked but results verification failed, attempt {attempt + 1}")
-                        continue
-                else:
-                    print(f"Could not find back button, attempt {attempt + 1}")
+                print("✅ Returned to results page")
+                return True
 
             except Exception as e:
                 print(f"Back to results attempt {attempt + 1} failed: {e}")
                 if attempt < retries - 1:
-                    await asyncio.sleep(1.2)
+                    await asyncio.sleep(backoff_delay(attempt, 0.4))
                 continue
 
         print("❌ Failed to return to results after all attempts")
         return False
 
     # === REPLACE THE MAIN SCRAPING METHOD ===
-    async def scrape_all_records_via_next_button(self):
-        """Fixed scraping method using working navigation pattern."""
-        all_records = []
-        page_index = 1
-        max_pages = 72  # Adjust as needed
+    async def open_search_results(self, from_date: str = DEFAULT_FROM_DATE, to_date: str = None):
+        """Log in, run the filing-date search and wait for the first results page."""
+        await self.goto_login()
+        await self.accept_terms()
+        await self.click_search_public_records()
+        await self.enter_filing_dates(from_date, to_date)
+        await self.click_search_button()
+        await self.collect_result_row_links(timeout=60000)
+        self.results_page = 1
+
+    async def scrape_results_page(self, page_index, seen, page_ids, out_fp=None, max_records=None):
+        """
+        Scrape every record on the results page currently displayed, or only
+        until max_records records have been taken from it.
+        page_ids maps page number -> row keys for every page of this run, shared
+        by all sessions, since the pager shows the last page again past the end.
+        Returns the page's records, or None when page 1 has no results or the
+        page repeats an earlier one (end of pagination). A later page whose rows
+        never load raises, so the caller can retry it.
+        """
+        print(f"\n{'='*50}")
+        print(f"📄 PROCESSING PAGE {page_index}")
+        print(f"{'='*50}")
 
-        print("🎯 Starting comprehensive record scraping...")
+        # Wait for results list to be ready and read all row metadata at once
+        try:
+            row_metas = await self.collect_result_row_links(timeout=15000)
+        except Exception:
+            if page_index > 1:
+                # Past the end the pager shows the last page again, so a later
+                # page without rows failed to load rather than ran out of results
+                raise
+            print(f"❌ No results found on page {page_index}. Stopping.")
+            return None
+
+        # Stop if pagination handed back a page already seen in this run
+        ids = frozenset(self._row_key(m) for m in row_metas)
+        repeat_of = next((p for p, other in page_ids.items() if p < page_index and other == ids), None)
+        page_ids[page_index] = ids
+        if ids and repeat_of is not None:
+            print(f"⏹️ Page {page_index} repeats page {repeat_of}, stopping")
+            return None
+
+        # Skip rows already scraped on an earlier page (repeats at page boundaries)
+        fresh_metas = [m for m in row_metas if not self._row_key(m) or self._row_key(m) not in seen]
+        if len(fresh_metas) < len(row_metas):
+            print(f"  ⏭️ Skipping {len(row_metas) - len(fresh_metas)} rows already scraped")
+        row_metas = fresh_metas
+        seen.update(self._row_key(m) for m in row_metas if self._row_key(m))
+
+        page_records = []
+        consecutive_misses = 0
+
+        # Process every record listed on this page
+        for row_idx, meta in enumerate(row_metas):
+            if max_records is not None and len(page_records) >= max_records:
+                print(f"  ⏹️ Record limit reached on page {page_index}")
+                break
+            print(f"  📝 Processing record {row_idx + 1} of {len(row_metas)} on page {page_index}")
 
-        while page_index <= max_pages:
-            print(f"\n{'='*50}")
-            print(f"📄 PROCESSING PAGE {page_index}")
-            print(f"{'='*50}")
+            # Click the record link
+            if SNIFF_REQUESTS and page_index == 1 and row_idx == 0:
+                success = await self.sniff_record_requests(meta)
+            else:
+                success = await self.click_result_row(meta)
+            if not success:
+                print(f"  ❌ Could not click record {row_idx + 1}")
+                consecutive_misses += 1
+                if consecutive_misses >= 3:
+                    print("  ⚠ Several consecutive misses, assuming end of page")
+                    break
+                continue
 
-            # Wait for results list to be ready
+            # Wait for document frame to load
             try:
-                await self._res_list_loc().locator("a.link#inst0, a.link[onclick*='loadRecord']").first.wait_for(timeout=15000)
-            except:
-                print(f"❌ No results found on page {page_index}. Stopping.")
-                break
+                await self._doc_loc().locator("body").first.wait_for(state="attached", timeout=20000)
+            except Exception as e:
+                print(f"  ❌ Failed to load details for record {row_idx + 1}: {e}")
+                consecutive_misses += 1
+                continue
 
-            processed_this_page = 0
-            consecutive_misses = 0
+            # Extract decedent info and case metadata concurrently
+            dec_info, case_meta = await asyncio.gather(
+                self.extract_decedent_info_atomic(),
+                self._extract_case_meta(),
+                return_exceptions=True,
+            )
+            if isinstance(dec_info, Exception):
+                print(f"  ⚠ Decedent extraction failed: {dec_info}")
+                dec_info = {}
+            else:
+                print(f"  ✅ Decedent info extracted")
 
-            # Process up to 40 records per page
-            for row_idx in range(40):
-                print(f"  📝 Processing record {row_idx + 1} of 40 on page {page_index}")
-
-                # Click the record link
-                success = await self.click_result_link_by_index(row_idx)
-                if not success:
-                    print(f"  ❌ Could not click record {row_idx + 1}")
-                    consecutive_misses += 1
-                    if consecutive_misses >= 3:
-                        print("  ⚠ Several consecutive misses, assuming end of page")
-                        break
-                    continue
+            # Extract representatives
+            reps = []
+            try:
+                clicked = await self.safe_click_tab("Representatives", retries=2)
+                if clicked:
+                    reps = await self.extract_representatives_atomic()
+                    print(f"  ✅ {len(reps)} representatives extracted")
+            except Exception as e:
+                print(f"  ⚠ Representatives extraction failed: {e}")
+
+            # Combine data
+            # Every record carries every XLSX column so the export can use itemgetter
+            base_record = {
+                "case_file_no": dec_info.get("case_file_no", ""),
+                "filing_date": dec_info.get("filing_date", ""),
+                "decedent_address": dec_info.get("decedent_address", ""),
+                "caseFileNum": "",
+                "caseFileId": "",
+                **case_meta,
+            }
+
+            if reps:
+                record_data = [{**base_record, **rep} for rep in reps]
+            else:
+                record_data = [{**base_record, "representative_name": "", "representative_address": ""}]
 
-                # Wait for document frame to load
-                try:
-                    await self._doc_loc().locator("body").first.wait_for(state="attached", timeout=20000)
-                    await asyncio.sleep(1.0)
-                except Exception as e:
-                    print(f"  ❌ Failed to load details for record {row_idx + 1}: {e}")
-                    consecutive_misses += 1
-                    continue
+            page_records.extend(record_data)
+            if out_fp is not None:
+                for r in record_data:
+                    out_fp.write(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE))
+                out_fp.flush()  # checkpoint: a killed run keeps every finished case
+            consecutive_misses = 0
 
-                # Extract decedent info
-                dec_info = {}
-                try:
-                    dec_info = await self.extract_decedent_info_atomic()
-                    print(f"  ✅ Decedent info extracted")
-                except Exception as e:
-                    print(f"  ⚠ Decedent extraction failed: {e}")
+            print(f"  ✅ Record {row_idx + 1} processed: {len(record_data)} entries")
 
-                # Extract representatives
-                reps = []
-                try:
-                    clicked = await self.safe_click_tab("Representatives", retries=2)
-                    if clicked:
-                        await asyncio.sleep(1.0)
-                        reps = await self.extract_representatives_atomic()
-                        print(f"  ✅ {len(reps)} representatives extracted")
-                except Exception as e:
-                    print(f"  ⚠ Representatives extraction failed: {e}")
-
-                # Get case metadata from URL
-                case_meta = {}
-                try:
-                    for f in self.page.frames:
-                        if f.url and "DocumentInfoView.jsp" in f.url and "caseFileId=" in f.url:
-                            qs = parse_qs(urlparse(f.url).query)
-                            case_meta = {
-                                "caseFileId": (qs.get("caseFileId") or [""])[0],
-                                "caseFileNum": (qs.get("caseFileNum") or [""])[0],
-                            }
-                            break
-                except Exception as e:
-                    print(f"  ⚠ Case metadata error: {e}")
-
-                # Combine data
-                base_record = {
-                    "case_file_no": dec_info.get("case_file_no", ""),
-                    "filing_date": dec_info.get("filing_date", ""),
-                    "decedent_address": dec_info.get("decedent_address", ""),
-                    **case_meta,
-                }
-
-                if reps:
-                    record_data = [{**base_record, **rep} for rep in reps]
-                else:
-                    record_data = [{**base_record, "representative_name": "", "representative_address": ""}]
+            # Return to results page
+            back_success = await self.click_back_to_results()
+            if not back_success:
+                print("  ❌ Failed to return to results, stopping page processing")
+                break
 
-                all_records.extend(record_data)
-                processed_this_page += len(record_data)
-                consecutive_misses = 0
+        print(f"✅ Page {page_index} complete: {len(page_records)} records extracted")
+        return page_records
 
-                print(f"  ✅ Record {row_idx + 1} processed: {len(record_data)} entries")
+    async def scrape_all_records_via_next_button(self, out_fp=None, seen=None, max_records=None):
+        """
+        Fixed scraping method using working navigation pattern.
+        If out_fp (a binary file) is given, records are streamed to it as NDJSON
+        instead of being kept, and the number written is returned.
+        Rows whose key is already in seen are skipped; scraping stops after
+        max_records records if given.
+        """
+        all_records = []
+        total = 0
+        page_index = 1
+        max_pages = 72  # Adjust as needed
 
-                # Return to results page
-                back_success = await self.click_back_to_results()
-                if not back_success:
-                    print("  ❌ Failed to return to results, stopping page processing")
-                    break
+        print("🎯 Starting comprehensive record scraping...")
 
-                await asyncio.sleep(0.5)
+        seen = set() if seen is None else seen
+        page_ids = {}
 
-            print(f"✅ Page {page_index} complete: {processed_this_page} records extracted")
+        while page_index <= max_pages:
+            remaining = None if max_records is None else max_records - total
+            try:
+                page_records = await self.scrape_results_page(page_index, seen, page_ids, out_fp, remaining)
+            except PlaywrightError as e:
+                print(f"❌ Page {page_index} did not load ({e}), stopping")
+                break
+            if page_records is None:
+                break
+            total += len(page_records)
+            if out_fp is None:
+                all_records.extend(page_records)
+            if max_records is not None and total >= max_records:
+                print(f"⏹️ Reached {max_records} records, stopping")
+                break
 
             # Navigate to next page
             if page_index < max_pages:
@@ -656,16 +1030,31 @@ class DelawareScraper:
                     print("❌ Failed to navigate to next page, stopping")
                     break
                 page_index += 1
-                await asyncio.sleep(1.0)
             else:
                 break
 
         print(f"\n{'='*50}")
         print(f"🎉 SCRAPING COMPLETE")
-        print(f"📊 {len(all_records)} total records extracted")
+        print(f"📊 {total} total records extracted")
         print(f"{'='*50}")
 
-        return all_records
+        return total if out_fp is not None else all_records
+
+    def _expect_results_reload(self, timeout: int):
+        """Start listening for the results frames to navigate; arm before triggering it."""
+        return asyncio.ensure_future(self.page.wait_for_event(
+            "framenavigated",
+            predicate=lambda f: f.name in ("resultFrame", "resultListFrame"),
+            timeout=timeout,
+        ))
+
+    async def _wait_results_reloaded(self, nav, timeout: int):
+        """Wait for an armed results reload, then for the new list's row links."""
+        try:
+            await nav
+        except PlaywrightTimeoutError:
+            print("⚠ Results frame did not navigate; checking the current list")
+        await self._row_links_loc().first.wait_for(timeout=timeout)
 
     async def goto_results_page(self, page_number: int, wait_timeout: int = 20000) -> bool:
         """
@@ -676,12 +1065,14 @@ class DelawareScraper:
         and finally waits for the results list to become available.
         """
         print(f"🔎 goto_results_page -> target {page_number}")
+        nav = None
         # First try the known subnav locator (fast path)
         try:
             subnav = self._res_subnav_middle_loc()
             input_locator = subnav.locator("input[name='pageNumber']").first
             await input_locator.wait_for(state="attached", timeout=6000)
             await input_locator.fill(str(page_number))
+            nav = self._expect_results_reload(wait_timeout)
 
             # Try clicking a Go link if present
             go_link = subnav.locator("a[onclick*='goToResultPage'], a[onclick*='goToResultPage()']").first
@@ -690,26 +1081,26 @@ class DelawareScraper:
                     await go_link.click()
                 except Exception:
                     # fallback to evaluating JS on the frame
-                    await subnav.evaluate("() => { if (window.goToResultPage) goToResultPage(); }")
+                    await subnav.locator("body").evaluate(GO_TO_RESULT_PAGE_JS)
             else:
                 # Try calling the function directly in that frame
-                await subnav.evaluate("() => { if (window.goToResultPage) goToResultPage(); }")
+                await subnav.locator("body").evaluate(GO_TO_RESULT_PAGE_JS)
 
             # wait for results list to refresh
-            res = self._res_list_loc()
-            await res.locator("a.link#inst0, a.link[onclick*='loadRecord']").first.wait_for(timeout=wait_timeout)
-            await asyncio.sleep(0.6)
+            await self._wait_results_reloaded(nav, wait_timeout)
             print(f"✅ Navigated to page {page_number} (fast path)")
             return True
 
         except Exception as fast_err:
+            if nav is not None:
+                nav.cancel()
             print(f"⚠ fast path for goto_results_page failed: {fast_err}")
 
         # Fallback: search frames for an input[name='pageNumber'] (mirrors simple_page_navigation)
         try:
             input_frame = None
             input_element = None
-
+            # The pager frame navigates on every page change, so handles are found afresh each time
             for f in self.page.frames:
                 try:
                     handles = await f.query_selector_all("input[name='pageNumber']")
@@ -724,28 +1115,12 @@ class DelawareScraper:
                 print("❌ Could not find pageNumber input in any frame (fallback)")
                 return False
 
-            # Fill the input using the frame handle
             await input_element.fill(str(page_number))
+            nav = self._expect_results_reload(wait_timeout)
 
             # Try to call the JS navigation function in that frame
             try:
-                result = await input_frame.evaluate(
-                    """() => {
-                        try {
-                            if (typeof goToResultPage === 'function') { goToResultPage(); return true; }
-                            if (window.goToResultPage) { window.goToResultPage(); return true; }
-                            // try clicking any nearby 'Go' button if present
-                            const goBtn = Array.from(document.querySelectorAll('a, input, button')).find(el =>
-                                (el.getAttribute && (el.getAttribute('onclick') || '').includes('goToResultPage')) ||
-                                (el.textContent && /go\s*to\s*result/i.test(el.textContent))
-                            );
-                            if (goBtn) { goBtn.click(); return true; }
-                            return false;
-                        } catch (e) {
-                            return false;
-                        }
-                    }"""
-                )
+                result = await input_frame.evaluate(GO_TO_RESULT_PAGE_JS)
                 if not result:
                     print("⚠ Fallback JS navigation did not report success; continuing to wait for result marker")
 
@@ -754,10 +1129,7 @@ class DelawareScraper:
 
             # Wait for results list to refresh
             try:
-                # The results list lives in resultListFrame — use the locator helper
-                res = self._res_list_loc()
-                await res.locator("a.link#inst0, a.link[onclick*='loadRecord']").first.wait_for(timeout=wait_timeout)
-                await asyncio.sleep(0.6)
+                await self._wait_results_reloaded(nav, wait_timeout)
                 print(f"✅ Navigated to page {page_number} (fallback)")
                 return True
             except Exception as wait_err:
@@ -769,6 +1141,9 @@ class DelawareScraper:
             return False
 
     # === KEEP YOUR EXISTING EXPORT METHOD ===
+    # Don't reach for numba/Cython here: the export is dict lookups and string formatting,
+    # which nopython mode can't compile, and object-mode fallback is slower than plain CPython.
+    # Large exports take write_monthwise_xlsx_fast instead.
     def write_monthwise_xlsx(self, records, out_path):
         """
         records: list of dicts with keys:
@@ -780,67 +1155,333 @@ class DelawareScraper:
         - caseFileNum
         Creates an XLSX with one sheet per YYYY-MM.
         """
-        wb = Workbook()
-        if wb.active:
-            wb.remove(wb.active)
-
-        by_month = defaultdict(list)
-        for r in records:
-            fd = (r.get("filing_date") or "").strip()
-            month_key = "Unknown"
+        if len(records) >= XLSX_FAST_MIN_ROWS:
+            return self.write_monthwise_xlsx_fast(records, out_path)
+
+        # constant_memory flushes each row to disk as soon as the next one starts
+        wb = xlsxwriter.Workbook(str(out_path), {"constant_memory": True, "strings_to_urls": False})
+
+        for month, rows, widths in _month_sheets(records):
+            ws = wb.add_worksheet(month)
+            for col, width in enumerate(widths):
+                ws.set_column(col, col, width)
+
+            ws.write_row(0, 0, XLSX_HEADERS)
+            for row_idx, row_values in enumerate(rows, start=1):
+                ws.write_row(row_idx, 0, row_values)
+
+        wb.close()
+        print(f"✅ XLSX written: {out_path}")
+
+    def write_monthwise_xlsx_fast(self, records, out_path):
+        """
+        Same workbook as write_monthwise_xlsx, but the sheet XML is written straight
+        into the zip with inline strings, skipping XlsxWriter's per-cell type dispatch.
+        Used for large exports.
+        """
+        sheet_names = []
+        header_xml = "".join(map(_xlsx_cell, XLSX_HEADERS))
+
+        with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED, compresslevel=XLSX_COMPRESSLEVEL) as zf:
+            for n, (month, rows, widths) in enumerate(_month_sheets(records), start=1):
+                sheet_names.append(month)
+                cols = "".join(
+                    f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>'
+                    for i, w in enumerate(widths, start=1)
+                )
+                with zf.open(f"xl/worksheets/sheet{n}.xml", "w") as fp:
+                    fp.write(XLSX_SHEET_HEAD_XML.format(cols=cols).encode())
+                    fp.write(f'<row r="1">{header_xml}</row>'.encode())
+                    fp.write("".join(
+                        f'<row r="{i}">{"".join(map(_xlsx_cell, row_values))}</row>'
+                        for i, row_values in enumerate(rows, start=2)
+                    ).encode())
+                    fp.write(XLSX_SHEET_TAIL_XML.encode())
+
+            numbered = list(enumerate(sheet_names, start=1))
+            zf.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES_XML.format(
+                overrides="".join(XLSX_SHEET_OVERRIDE_XML.format(n=n) for n, _ in numbered)))
+            zf.writestr("_rels/.rels", XLSX_ROOT_RELS_XML)
+            zf.writestr("xl/workbook.xml", XLSX_WORKBOOK_XML.format(sheets="".join(
+                f'<sheet name="{xml_escape(name, {chr(34): "&quot;"})}" sheetId="{n}" r:id="rId{n}"/>'
+                for n, name in numbered)))
+            zf.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELS_XML.format(
+                rels="".join(XLSX_WORKBOOK_REL_XML.format(n=n) for n, _ in numbered)))
+
+        print(f"✅ XLSX written (direct XML): {out_path}")
+
+
+class BrowserContextPool:
+    """
+    Pool of browser contexts that are already logged in with search results open.
+    Contexts are warmed up front so workers can acquire a ready session at once;
+    crashed or long-idle sessions are replaced on acquire.
+    """
+
+    def __init__(self, browser, max_size: int = POOL_MAX_SIZE, from_date: str = DEFAULT_FROM_DATE,
+                 to_date: str = None, idle_timeout: float = POOL_IDLE_TIMEOUT):
+        self.browser = browser
+        self.max_size = max_size
+        self.from_date = from_date
+        # Fixed once: sessions built later (e.g. after midnight) must run the same search
+        self.to_date = to_date or datetime.today().strftime("%m/%d/%Y")
+        self.idle_timeout = idle_timeout
+        self._queue = asyncio.Queue(maxsize=max_size)
+        self._owned = []  # scrapers whose contexts this pool created and must close
+        self.size = 0
+
+    async def _new_scraper(self):
+        context = await self.browser.new_context(ignore_https_errors=True)
+        try:
+            page = await context.new_page()
+            scraper = DelawareScraper(page, browser=self.browser, context=context)
+            await scraper.block_static_resources()
+            await scraper.open_search_results(self.from_date, self.to_date)
+        except Exception:
+            await context.close()
+            raise
+        self._owned.append(scraper)
+        return scraper
+
+    def add(self, scraper):
+        """Hand an already-open scraper session to the pool (the caller keeps ownership)."""
+        self._queue.put_nowait((scraper, time.monotonic()))
+        self.size += 1
+
+    async def start(self):
+        """Open and warm up contexts until the pool holds max_size sessions."""
+        missing = self.max_size - self.size
+        print(f"🏊 Warming {missing} browser contexts...")
+        results = await asyncio.gather(*(self._new_scraper() for _ in range(missing)), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"⚠ Failed to warm a browser context: {result}")
+            else:
+                self.add(result)
+        if not self.size:
+            raise RuntimeError("No browser context could be started")
+        print(f"✅ Context pool ready with {self.size} sessions")
+
+    async def health_check(self, scraper) -> bool:
+        try:
+            await scraper.page.evaluate("1")
+            return True
+        except Exception:
+            return False
+
+    async def _discard(self, scraper):
+        if scraper in self._owned:
+            self._owned.remove(scraper)
             try:
-                dt = datetime.strptime(fd, "%m/%d/%Y")
-                month_key = dt.strftime("%Y-%m")
+                await scraper.context.close()
             except Exception:
-                try:
-                    dt = datetime.strptime(fd, "%m/%d/%y")
-                    month_key = dt.strftime("%Y-%m")
-                except Exception:
-                    pass
-            by_month[month_key].append(r)
+                pass
 
-        headers = ["case_file_no", "filing_date", "caseFileNum", "caseFileId", "decedent_address", "representative_name", "representative_address"]
+    async def acquire(self):
+        """Take a ready session, replacing it first if it crashed or sat idle too long."""
+        scraper, released_at = await self._queue.get()
+        idle = time.monotonic() - released_at
+        if idle > self.idle_timeout or not await self.health_check(scraper):
+            print(f"♻️ Replacing browser context (idle {idle:.0f}s)")
+            await self._discard(scraper)
+            try:
+                scraper = await self._new_scraper()
+            except Exception:
+                self.size -= 1
+                raise
+        return scraper
 
-        for month in sorted(by_month.keys()):
-            ws = wb.create_sheet(title=month[:31])
-            ws.append(headers)
-            for r in by_month[month]:
-                ws.append([r.get(h, "") for h in headers])
+    def release(self, scraper):
+        self._queue.put_nowait((scraper, time.monotonic()))
 
-            # Auto-adjust column widths
-            for col_idx, h in enumerate(headers, start=1):
-                max_len = max([len(str(h))] + [len(str(ws.cell(row=i, column=col_idx).value or "")) for i in range(2, ws.max_row + 1)])
-                ws.column_dimensions[get_column_letter(col_idx)].width = min(60, max_len + 2)
+    async def close(self):
+        for scraper in list(self._owned):
+            await self._discard(scraper)
 
-        wb.save(out_path)
-        print(f"✅ XLSX written: {out_path}")
+
+def write_json_array(path, records):
+    """Write records as a JSON array one element at a time, never holding the whole document."""
+    with path.open("wb") as fp:
+        fp.write(b"[")
+        for i, r in enumerate(records):
+            if i:
+                fp.write(b",")
+            fp.write(orjson.dumps(r))
+        fp.write(b"]")
+
+
+def load_checkpoint(path):
+    """
+    Return the caseFileIds already in an NDJSON checkpoint.
+    A torn last line from a killed run is cut off so appends start on a clean line.
+    """
+    seen = set()
+    if not path.exists():
+        return seen
+    with path.open("r+b") as fp:
+        good_end = 0
+        for line in fp:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                case_file_id = orjson.loads(line).get("caseFileId")
+            except orjson.JSONDecodeError:
+                break
+            if case_file_id:
+                seen.add(case_file_id)
+            good_end += len(line)
+        fp.truncate(good_end)
+    return seen
 
 
-async def run_full_scrape_and_export(scraper):
+async def scrape_all_records_concurrently(pool, out_fp=None, seen=None, max_records=None):
+    """
+    Scrape result pages in parallel across the pool's search sessions.
+    One task per session claims page numbers from a shared counter, acquires
+    a session for each page and jumps that session to the page.
+    With out_fp, records are only streamed there and the count is returned.
+    With max_records, no new pages are claimed once that many are scraped;
+    pages already in progress still finish.
+    A page that fails is handed back for another session, up to PAGE_ATTEMPTS
+    tries; only a repeated page or an empty first page ends pagination.
+    """
+    max_pages = 72  # Adjust as needed
+    page_numbers = count(1)
+    retry_pages = []  # (page_index, failures) waiting for another try
+    missing_pages = []
+    last_page = max_pages
+    seen = set() if seen is None else seen
+    page_ids = {}  # shared, so a session can spot a page another session already showed
+    scraped = 0
+
+    print(f"🎯 Starting concurrent record scraping with {pool.size} sessions...")
+
+    def claim():
+        """Next page to scrape: failed pages first, then the next unclaimed one."""
+        return retry_pages.pop() if retry_pages else (next(page_numbers), 0)
+
+    async def drain():
+        nonlocal last_page, scraped
+        results = []
+        while True:
+            page_index, failures = claim()
+            if page_index > last_page:
+                if failures:
+                    continue  # a retry past the end found meanwhile
+                break
+            try:
+                scraper = await pool.acquire()
+            except Exception as e:
+                # A session that cannot be rebuilt only takes its own worker down
+                print(f"⚠ Could not replace a browser session ({e}), stopping this worker")
+                retry_pages.append((page_index, failures))
+                if not pool.size:
+                    print("❌ No browser sessions left")
+                return results
+            try:
+                if scraper.results_page != page_index:
+                    if not await scraper.goto_results_page(page_index):
+                        raise PlaywrightTimeoutError(f"could not navigate to page {page_index}")
+                    scraper.results_page = page_index
+                page_records = await scraper.scrape_results_page(page_index, seen, page_ids, out_fp)
+            except PlaywrightError as e:
+                scraper.results_page = None  # where the session ended up is unknown
+                failures += 1
+                if failures < PAGE_ATTEMPTS:
+                    print(f"⚠ Page {page_index} failed ({e}), retrying it ({failures}/{PAGE_ATTEMPTS})")
+                    retry_pages.append((page_index, failures))
+                else:
+                    print(f"❌ Page {page_index} failed {failures} times, giving up on it")
+                    missing_pages.append(page_index)
+                continue
+            finally:
+                pool.release(scraper)
+            if page_records is None:
+                last_page = min(last_page, page_index - 1)
+                break
+            scraped += len(page_records)
+            if max_records is not None and scraped >= max_records:
+                last_page = min(last_page, page_index)
+            results.append((page_index, len(page_records) if out_fp is not None else page_records))
+        return results
+
+    # An unexpected error cancels the sibling drains; each hands its session back on the way out
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(drain()) for _ in range(pool.size)]
+
+    pages = sorted((p for task in tasks for p in task.result()), key=itemgetter(0))
+    missing_pages.extend(p for p, _ in retry_pages if p <= last_page)
+    if out_fp is not None:
+        total = sum(n for _, n in pages)
+    else:
+        # Reassemble in page order so output matches the serial scrape
+        all_records = [r for _, page_records in pages for r in page_records]
+        total = len(all_records)
+
+    print(f"\n{'='*50}")
+    print(f"🎉 SCRAPING COMPLETE")
+    print(f"📊 {total} total records extracted from {len(pages)} pages")
+    if missing_pages:
+        print(f"⚠️ Pages not scraped: {sorted(missing_pages)}")
+    print(f"{'='*50}")
+
+    return total if out_fp is not None else all_records
+
+
+async def run_full_scrape_and_export(scraper, max_records=None, to_date=None):
     """
     Run the complete scraping process and export results.
     Only keep records that have representative_name and representative_address.
+    max_records caps the records scraped in this run (e.g. a resume that only needs the delta).
+    to_date is the Filing Date To the scraper's search used; pool sessions search the same range.
     """
     print("🚀 Starting full scraping process...")
-    all_records = await scraper.scrape_all_records_via_next_button()
-
-    # ✅ Filter records to only keep those with representative info
-    filtered_records = [
-        r for r in all_records
-        if r.get("representative_name") and r.get("representative_address")
-    ]
 
     # Ensure output directory exists
     OUT_DIR.mkdir(exist_ok=True)
 
-    # Save JSON file
-    json_path = OUT_DIR / "all_records.json"
-    json_path.write_text(json.dumps(filtered_records, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"✅ JSON saved: {json_path}")
+    # Stream raw records to NDJSON while scraping so a crash keeps partial results
+    ndjson_path = OUT_DIR / "all_records.ndjson"
+    seen = load_checkpoint(ndjson_path) if RESUME else set()
+    if seen:
+        print(f"♻️ Resuming: {len(seen)} cases already in {ndjson_path}")
+    with ndjson_path.open("ab" if RESUME else "wb") as out_fp:
+        if scraper.browser is not None and POOL_MAX_SIZE > 1:
+            pool = BrowserContextPool(scraper.browser, to_date=to_date)
+            pool.add(scraper)
+            try:
+                await pool.start()
+                total = await scrape_all_records_concurrently(pool, out_fp=out_fp, seen=seen,
+                                                              max_records=max_records)
+            finally:
+                await pool.close()
+        else:
+            total = await scraper.scrape_all_records_via_next_button(out_fp=out_fp, seen=seen,
+                                                                     max_records=max_records)
+    print(f"✅ NDJSON saved: {ndjson_path} ({total} records)")
+
+    # ✅ Read back only the records with representative info; the rest never reach memory together
+    with ndjson_path.open("rb") as fp:
+        filtered_records = [
+            r for r in map(orjson.loads, fp)
+            if r.get("representative_name") and r.get("representative_address")
+        ]
 
-    # Save XLSX file with month-wise sheets
+    json_path = OUT_DIR / "all_records.json"
     xlsx_path = OUT_DIR / "delaware_records_monthwise.xlsx"
-    scraper.write_monthwise_xlsx(filtered_records, xlsx_path)
+    if not filtered_records:
+        # Keep an empty JSON as the run's audit trail; an XLSX with no sheets is not worth writing
+        json_path.write_bytes(b"[]")
+        print(f"⚠ No records had representative info; wrote empty {json_path}, skipped XLSX")
+        return []
+
+    # Save the JSON file and the month-wise XLSX side by side in worker threads;
+    # neither writer mutates the records
+    await asyncio.gather(
+        asyncio.to_thread(write_json_array, json_path, filtered_records),
+        asyncio.to_thread(scraper.write_monthwise_xlsx, filtered_records, xlsx_path),
+    )
+    print(f"✅ JSON saved: {json_path}")
     print(f"✅ XLSX saved: {xlsx_path}")
 
     return filtered_records
@@ -848,43 +1489,63 @@ async def run_full_scrape_and_export(scraper):
 
 
 async def main():
-    """Main function with persistent context for stability."""
-    # Use persistent context like the working code
-    profile_dir = Path(os.environ.get("CHROME_PROFILE_DIR", "chrome_profile")).resolve()
-    profile_dir.mkdir(exist_ok=True)
-    print(f"Using Chrome profile: {profile_dir}")
+    """
+    Main function. Browser mode, first match wins:
+    - DELAWARE_CDP_URL: attach to an already running Chrome
+    - pool size > 1 (the default): launch Chrome, one fresh context per session
+    - DELAWARE_WORKERS=1: single session in the persistent chrome_profile
+    """
+    launch_args = [
+        "--disable-blink-features=AutomationControlled",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--disable-renderer-backgrounding",
+        "--disable-background-timer-throttling",
+    ]
 
     async with async_playwright() as pw:
-        context = await pw.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
-            channel="chrome",
-            headless=False,
-            ignore_https_errors=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
-        )
+        browser = None
+        if CDP_URL:
+            # Long-lived browser: closing it at the end only disconnects and drops our contexts
+            browser = await pw.chromium.connect_over_cdp(CDP_URL)
+            context = await browser.new_context(ignore_https_errors=True)
+        elif POOL_MAX_SIZE > 1:
+            # Parallel scraping needs separate contexts, each with its own search session
+            browser = await pw.chromium.launch(channel="chrome", headless=HEADLESS, args=launch_args)
+            context = await browser.new_context(ignore_https_errors=True)
+        else:
+            # Single session: persistent profile, like the working code
+            profile_dir = Path(os.environ.get("CHROME_PROFILE_DIR", "chrome_profile")).resolve()
+            profile_dir.mkdir(exist_ok=True)
+            print(f"Using Chrome profile: {profile_dir}")
+            context = await pw.chromium.launch_persistent_context(
+                user_data_dir=str(profile_dir),
+                channel="chrome",
+                headless=HEADLESS,
+                ignore_https_errors=True,
+                args=launch_args,
+            )
 
         page = context.pages[0] if context.pages else await context.new_page()
-        scraper = DelawareScraper(page, browser=None, context=context)
+        scraper = DelawareScraper(page, browser=browser, context=context)
+        await scraper.block_static_resources()
         
         try:
-            # Execute the scraping workflow
-            await scraper.goto_login()
-            await scraper.accept_terms()
-            await scraper.click_search_public_records()
-            await scraper.enter_filing_dates()
-            await scraper.click_search_button()
-            
-            # Wait for results to load
-            await asyncio.sleep(10)
+            # Execute the scraping workflow and wait for results to load
+            # One Filing Date To for the whole run, so every session pages through the same results
+            to_date = datetime.today().strftime("%m/%d/%Y")
+            await scraper.open_search_results(to_date=to_date)
             
             # Run the full scraping and export
-            await run_full_scrape_and_export(scraper)
+            await run_full_scrape_and_export(scraper, max_records=MAX_RECORDS, to_date=to_date)
             
         except Exception as e:
             print("❌ Scraper failed with exception:")
@@ -896,6 +1557,8 @@ async def main():
             raise
         finally:
             await context.close()
+            if browser is not None:
+                await browser.close()
 
 
 if __name__ == "__main__":